@@ -3,10 +3,7 @@
 Live popup test - shows the popup and keeps it open for voice testing
 """
 
-import sys
-import time
 import threading
-sys.path.append('src')
 
 def live_test():
     """Show popup and keep it open for voice testing"""
@@ -64,7 +61,9 @@ def live_test():
                 
                 remaining = 30 - i
                 print(f"⏳ {remaining} seconds remaining... (speak now to test waveform!)", end='\r')
-                time.sleep(1)
+                # Runs the Qt events (painting, buttons, audio monitoring) for
+                # the second, returning early if the user closes the popup
+                manager.wait_until_closed(timeout=1)
             
             print("\n⏰ 30 seconds elapsed - closing popup...")
             manager.hide_recording_popup()
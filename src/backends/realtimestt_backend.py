@@ -4,9 +4,11 @@ RealtimeSTT Backend Wrapper
 Drop-in replacement for WhisperTranscriptionService using RealtimeSTT engine
 """
 
+import threading
 from RealtimeSTT import AudioToTextRecorder
 from .transcription_base import TranscriptionService
 from ..core.transcription_state import ThreadSafeTranscriptionState
+from ..utils.process import create_daemon_thread
 
 
 class RealtimeSTTWrapper(TranscriptionService):
@@ -69,6 +71,18 @@ class RealtimeSTTWrapper(TranscriptionService):
 
         # Unified transcription state management
         self.transcription_state = ThreadSafeTranscriptionState()
+        self._last_partial = None  # Last partial text seen, to drop repeats
+
+        # Real-time echo is printed by a writer thread so a slow terminal
+        # never stalls RealtimeSTT's transcription callbacks. Partials go
+        # through a single-slot mailbox: only the newest one is ever printed.
+        self._echo_lock = threading.Lock()
+        self._echo_ready = threading.Event()
+        self._echo_partial = None   # Newest unprinted partial line
+        self._echo_stable = []      # Stabilized lines, never dropped
+        self._echo_thread = None
+        if self.enable_realtime:
+            self._start_echo_thread()
 
         # Initialize RealtimeSTT recorder
         self._initialize_recorder()
@@ -189,6 +203,7 @@ class RealtimeSTTWrapper(TranscriptionService):
 
             # Clear previous transcription state
             self.transcription_state.clear()
+            self._last_partial = None
 
             # Check if we're in manual mode (no silence duration = keyboard mode)
             if self.post_speech_silence_duration is None:
@@ -290,21 +305,59 @@ class RealtimeSTTWrapper(TranscriptionService):
 
     def _on_realtime_update(self, text):
         """Called with partial transcription updates"""
+        # RealtimeSTT often re-emits an unchanged partial; nothing to update
+        if text == self._last_partial:
+            return
+        self._last_partial = text
         self.transcription_state.update_text(text, is_final=False, is_stable=False)
         # Only show real-time updates if real-time mode is enabled
         if self.enable_realtime:
-            print(f"🔄 Partial: {text}")
+            self._echo_partial_line(f"🔄 Partial: {text}")
 
     def _on_realtime_stabilized(self, text):
         """Called when transcription segment is stabilized"""
         self.transcription_state.update_text(text, is_final=False, is_stable=True)
         # Only show stabilized updates if real-time mode is enabled
         if self.enable_realtime:
-            print(f"✅ Stable: {text}")
+            self._echo_stable_line(f"✅ Stable: {text}")
+
+    def _echo_partial_line(self, line):
+        """Replace any unprinted partial with the newest one"""
+        with self._echo_lock:
+            self._echo_partial = line
+        self._echo_ready.set()
+
+    def _echo_stable_line(self, line):
+        """Queue a stabilized line; it supersedes any pending partial"""
+        with self._echo_lock:
+            self._echo_stable.append(line)
+            self._echo_partial = None
+        self._echo_ready.set()
+
+    def _start_echo_thread(self):
+        """Start the echo writer thread if it is not already running"""
+        if self._echo_thread is None:
+            self._echo_thread = create_daemon_thread(self._drain_echo, name="RealtimeSTT-Echo")
+            self._echo_thread.start()
+
+    def _drain_echo(self):
+        """Print pending real-time updates (runs in echo writer thread)"""
+        while True:
+            self._echo_ready.wait()
+            self._echo_ready.clear()
+            with self._echo_lock:
+                lines, self._echo_stable = self._echo_stable, []
+                partial, self._echo_partial = self._echo_partial, None
+
+            for line in lines:
+                print(line)
+            if partial is not None:
+                print(partial)
 
     def enable_realtime_mode(self):
         """Enable real-time transcription mode (future enhancement)"""
         print("🚀 Enabling real-time mode...")
+        self._start_echo_thread()
 
         # Reinitialize with real-time enabled
         self.recorder = AudioToTextRecorder(
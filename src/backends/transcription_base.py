@@ -6,16 +6,58 @@ Supports both local Whisper models and cloud-based AWS Transcribe.
 
 from abc import ABC, abstractmethod
 from pynput import keyboard
+import asyncio
+import logging
+import subprocess
 import time
-import pyperclip
-from ..utils.accessibility import check_accessibility_permissions, get_accessibility_instructions, prompt_for_permissions, _execute_applescript_safely
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from ..utils.process import create_daemon_thread
+from ..utils.clipboard import copy_text_verified, write_clipboard, snapshot_clipboard, restore_clipboard_snapshot
+from ..utils.accessibility import check_accessibility_permissions, get_accessibility_instructions, prompt_for_permissions, send_paste_keystroke, _execute_applescript_safely
+
+# Per-transcription status goes to debug logging so the paste path doesn't
+# block on terminal writes; failures are warnings (shown even unconfigured)
+logger = logging.getLogger(__name__)
+
+
+def float_to_pcm16(audio_data, out=None):
+    """
+    Convert float audio to 16-bit PCM in a single vectorized pass
+
+    Clips that peak above 1.0 are scaled down to fit so no sample wraps
+    around in int16. The multiply writes straight into the int16 output, so
+    there is no float temporary.
+
+    Args:
+        audio_data: Float samples, nominally in [-1, 1]
+        out: Optional int16 array of the same shape to write into (reused scratch)
+
+    Returns:
+        np.ndarray: The int16 samples (out, when given)
+    """
+    audio_data = np.asarray(audio_data, dtype=np.float32)
+    # Peak from max/min avoids an abs() copy
+    max_val = max(float(audio_data.max()), -float(audio_data.min())) if audio_data.size else 0.0
+    scale = 32767 / max_val if max_val > 1.0 else 32767
+    if out is None:
+        out = np.empty(audio_data.shape, dtype=np.int16)
+    np.multiply(audio_data, scale, out=out, casting='unsafe')
+    return out
 
 
 class TranscriptionService(ABC):
     """Abstract base class for transcription services"""
+
+    # Shorter single-line ASCII text is typed directly instead of pasted
+    DIRECT_TYPE_MAX_CHARS = 32
     
     def __init__(self):
         self.pykeyboard = keyboard.Controller()
+        # Restores the user's clipboard after a paste, off the caller's path
+        self._restore_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clipboard-restore")
+        self._pending_restore = None
     
     @abstractmethod
     def transcribe(self, audio_data, language=None):
@@ -38,10 +80,10 @@ class TranscriptionService(ABC):
     
     def type_text(self, text):
         """Type the transcribed text with accessibility permission checking and clipboard fallback"""
-        print(f"Transcribed: {text}")
+        logger.debug("Transcribed: %s", text)
         
         if not text or text.strip() == "":
-            print("No text to type")
+            logger.debug("No text to type")
             return
         
         # Sanitize text to prevent clipboard issues
@@ -50,18 +92,11 @@ class TranscriptionService(ABC):
         text = ''.join(char for char in text if ord(char) >= 32 or char in '\n\t')
         
         if not text:
-            print("No valid text after sanitization")
+            logger.debug("No valid text after sanitization")
             return
         
-        # Preserve original clipboard content
-        original_clipboard = None
-        try:
-            original_clipboard = pyperclip.paste()
-            print(f"Preserving original clipboard content ({len(original_clipboard) if original_clipboard else 0} chars)")
-        except Exception as e:
-            print(f"Warning: Could not read original clipboard: {e}")
-        
-        # Check accessibility permissions first
+        # Check accessibility permissions first: without them nothing below can
+        # type or paste, so don't read the clipboard for a restore that never comes
         if not check_accessibility_permissions():
             print("Accessibility permissions required!")
             print(get_accessibility_instructions())
@@ -69,7 +104,7 @@ class TranscriptionService(ABC):
             # Offer clipboard fallback (no restoration needed since user will paste manually)
             print("Copying text to clipboard as fallback...")
             try:
-                pyperclip.copy(text)
+                write_clipboard(text)
                 print(f"Text copied to clipboard: '{text}'")
                 print("Paste using Cmd+V")
                 print("Note: Original clipboard content will be restored after you paste")
@@ -79,66 +114,75 @@ class TranscriptionService(ABC):
                 print(f"Manual copy needed: {text}")
                 return
         
+        # Fast path for short single-line ASCII (e.g. a one-word command):
+        # typing it never touches the clipboard, so there is nothing to
+        # preserve or restore and none of the paste settle delays
+        if len(text) < self.DIRECT_TYPE_MAX_CHARS and text.isascii() and text.isprintable():
+            try:
+                self.pykeyboard.type(text)
+                return
+            except Exception as e:
+                logger.warning("Direct typing failed, falling back to paste: %s", e)
+        
+        # A previous paste's restore must land before we read the clipboard
+        # again, or it would clobber this paste's text
+        if self._pending_restore is not None:
+            self._pending_restore.result()
+            self._pending_restore = None
+        
+        # Preserve original clipboard content
+        original_clipboard = None
+        try:
+            # Every pasteboard type, so an image or rich text survives the paste
+            original_clipboard = snapshot_clipboard()
+            logger.debug("Preserving original clipboard content (%s)", "present" if original_clipboard else "empty")
+        except Exception as e:
+            logger.warning("Could not read original clipboard: %s", e)
+        
         # Multi-tier approach with clipboard verification
         success = False
         
         # Method 1: Verified clipboard + AppleScript paste (most reliable)
         try:
             
-            # Copy to clipboard and verify with retries
-            copy_success = False
-            for retry in range(3):
-                pyperclip.copy(text)
-                time.sleep(0.2)  # Longer pause for clipboard update
-                
-                # Verify clipboard contents
-                clipboard_content = pyperclip.paste()
-                if clipboard_content == text:
-                    copy_success = True
-                    break
-                else:
-                    time.sleep(0.1)
+            # Copy to clipboard and verify (change count, or read-back retries)
+            copy_success = copy_text_verified(text)
             
             if copy_success:
-                # Use AppleScript for reliable paste on macOS
-                try:
-                    import subprocess
-                    applescript = 'tell application "System Events" to keystroke "v" using command down'
-                    result = subprocess.run(['osascript', '-e', applescript], 
-                                          capture_output=True, text=True, timeout=5)
-                    
-                    if result.returncode == 0:
-                        # Wait for paste to complete before proceeding
-                        time.sleep(0.3)
-                        success = True
-                except Exception as e:
-                    pass
+                # Post Cmd+V in-process when Quartz is available; otherwise
+                # spawn osascript (a fork/exec and interpreter start per paste)
+                if send_paste_keystroke():
+                    # Wait for paste to complete before proceeding
+                    time.sleep(0.3)
+                    success = True
+                else:
+                    # Use AppleScript for reliable paste on macOS
+                    try:
+                        applescript = 'tell application "System Events" to keystroke "v" using command down'
+                        result = subprocess.run(['osascript', '-e', applescript], 
+                                              capture_output=True, text=True, timeout=5)
+                        
+                        if result.returncode == 0:
+                            # Wait for paste to complete before proceeding
+                            time.sleep(0.3)
+                            success = True
+                    except Exception as e:
+                        pass
                 
         except Exception as e:
-            print(f"AppleScript method failed: {e}")
+            logger.warning("AppleScript method failed: %s", e)
         
         # Method 2: Verified clipboard + PyKeyboard (fallback)
         if not success:
             try:
                 
-                # Ensure clipboard is updated with retries
-                copy_success = False
-                for retry in range(3):
-                    pyperclip.copy(text)
-                    time.sleep(0.2)
-                    
-                    # Verify clipboard
-                    if pyperclip.paste() == text:
-                        copy_success = True
-                        break
-                    else:
-                        time.sleep(0.1)
+                # Ensure clipboard is updated
+                copy_success = copy_text_verified(text)
                 
                 if copy_success:
                     # Use PyKeyboard with corrected key sequence
                     self.pykeyboard.press(keyboard.Key.cmd)
                     self.pykeyboard.press('v')
-                    time.sleep(0.1)  # Hold the combination
                     self.pykeyboard.release('v')
                     self.pykeyboard.release(keyboard.Key.cmd)
                     
@@ -147,7 +191,7 @@ class TranscriptionService(ABC):
                     success = True
                     
             except Exception as e:
-                print(f"PyKeyboard method failed: {e}")
+                logger.warning("PyKeyboard method failed: %s", e)
         
         # Method 3: Optimized typing (reliable fallback)
         if not success:
@@ -156,61 +200,107 @@ class TranscriptionService(ABC):
                 success = True
                 
             except Exception as e:
-                print(f"Typing method failed: {e}")
+                logger.warning("Typing method failed: %s", e)
         
         # Method 4: Clipboard-only (final fallback)
         if not success:
             try:
-                pyperclip.copy(text)
+                write_clipboard(text)
                 
             except Exception as e:
                 print(f"All methods failed: {e}")
                 print(f"Manual input required: '{text}'")
                 print(f"Manual copy: {text}")
         
-        # Wait before restoring clipboard to ensure paste completed
-        if success:
-            time.sleep(0.5)  # Additional delay after paste completion
-        
-        # Restore original clipboard content
-        self._restore_clipboard(original_clipboard)
+        # Restore original clipboard content in the background; nothing
+        # waits on it, so the caller returns as soon as the paste is sent
+        self._pending_restore = self._restore_executor.submit(
+            self._restore_clipboard, original_clipboard, 0.5 if success else 0.0
+        )
     
-    def _restore_clipboard(self, original_content):
-        """Restore the original clipboard content with verification"""
+    def _restore_clipboard(self, original_content, delay=0.0):
+        """
+        Restore the original clipboard content (every saved pasteboard type)
+        
+        Args:
+            original_content: snapshot_clipboard() result saved before the paste
+            delay: Seconds to wait first so the paste has read the clipboard
+        """
         if original_content is not None:
+            # Wait before restoring clipboard to ensure paste completed
+            time.sleep(delay)
             try:
-                # Restore with retries to ensure it takes
-                for retry in range(3):
-                    pyperclip.copy(original_content)
-                    time.sleep(0.1)
-                    
-                    # Verify restoration
-                    if pyperclip.paste() == original_content:
-                        return
-                    else:
-                        time.sleep(0.1)
+                restore_clipboard_snapshot(original_content)
             except Exception as e:
                 pass
 
 
+# Loaded Whisper models by name, shared by every WhisperTranscriptionService
+_whisper_model_cache = {}
+
+
+def _limit_torch_threads():
+    """Run CPU inference on one torch thread per physical core"""
+    import torch
+    if torch.cuda.is_available():
+        return  # GPU inference; CPU thread count doesn't matter
+    try:
+        import psutil
+        physical_cores = psutil.cpu_count(logical=False)
+    except ImportError:
+        physical_cores = None
+    # OpenMP defaults to every logical CPU, so SMT siblings fight over the
+    # same core's caches; psutil reports real cores (no halving on Apple Silicon)
+    if physical_cores:
+        torch.set_num_threads(physical_cores)
+
+
+def _get_whisper_model(model_name):
+    """Get or load the openai-whisper model for a model name"""
+    model = _whisper_model_cache.get(model_name)
+    if model is None:
+        import whisper
+        _limit_torch_threads()
+        model = whisper.load_model(model_name)
+        _whisper_model_cache[model_name] = model
+    return model
+
+
 class WhisperTranscriptionService(TranscriptionService):
     """Local Whisper transcription service"""
     
     def __init__(self, model):
+        """
+        Args:
+            model: Loaded Whisper model, or a model name (tiny/base/small/medium/large)
+                   to load once and share across services
+        """
         super().__init__()
+        if isinstance(model, str):
+            model = _get_whisper_model(model)
         self.model = model
+        # FP16 halves matmul cost on CUDA tensor cores; on CPU whisper would
+        # warn and fall back to FP32 on every call, so decide once here
+        self.use_fp16 = model.device.type == "cuda"
     
     def transcribe(self, audio_data, language=None):
         """Transcribe using local Whisper model"""
-        print("Starting Whisper transcription...")
+        logger.debug("Starting Whisper transcription")
         try:
-            result = self.model.transcribe(audio_data, language=language)
+            # condition_on_previous_text=False: each 30s window decodes on its
+            # own, so a bad window can't feed a repetition loop into the next
+            result = self.model.transcribe(
+                audio_data,
+                language=language,
+                fp16=self.use_fp16,
+                condition_on_previous_text=False
+            )
             text = result['text']
-            print(f"Transcription completed: '{text}'")
+            logger.debug("Transcription completed: %r", text)
             self.type_text(text)
             return text
         except Exception as e:
-            print(f"Whisper transcription error: {e}")
+            logger.error("Whisper transcription error: %s", e)
             return ""
     
     def cleanup(self):
@@ -219,19 +309,87 @@ class WhisperTranscriptionService(TranscriptionService):
         pass
 
 
+# AWS Transcribe streaming clients by region, shared by every AWSTranscriptionService
+_aws_client_cache = {}
+
+
+def _session_credential_resolver(session):
+    """
+    Build a credential resolver that reads a boto3 session on every request
+
+    A static snapshot would outlive temporary (STS/SSO) credentials and break
+    every service sharing the cached client; botocore refreshes the session's
+    credentials itself, so each stream gets current ones.
+
+    Args:
+        session: boto3.Session whose credentials to use
+
+    Returns:
+        amazon_transcribe CredentialResolver
+    """
+    from amazon_transcribe.auth import CredentialResolver, Credentials
+
+    class SessionCredentialResolver(CredentialResolver):
+        async def get_credentials(self):
+            credentials = session.get_credentials()
+            if not credentials:
+                return None
+            frozen = credentials.get_frozen_credentials()
+            return Credentials(
+                access_key_id=frozen.access_key,
+                secret_access_key=frozen.secret_key,
+                session_token=frozen.token
+            )
+
+    return SessionCredentialResolver()
+
+
 class AWSTranscriptionService(TranscriptionService):
     """AWS Transcribe streaming transcription service"""
+
+    TRANSCRIBE_TIMEOUT = 15  # Seconds to wait for a streaming transcription
+
+    # Whisper language codes → AWS Transcribe language codes (built once, not
+    # per call; read-only so no caller can mutate the shared table)
+    DEFAULT_LANGUAGE_CODE = 'en-US'
+    LANGUAGE_CODES = MappingProxyType({
+        'en': 'en-US',
+        'es': 'es-US',
+        'fr': 'fr-FR',
+        'de': 'de-DE',
+        'it': 'it-IT',
+        'pt': 'pt-BR',
+        'ja': 'ja-JP',
+        'ko': 'ko-KR',
+        'zh': 'zh-CN'
+    })
     
     def __init__(self, region_name='us-east-1'):
         super().__init__()
         self.region_name = region_name
+        # Build the client first: it can raise, and the loop thread below
+        # would otherwise be left running for a service that never existed
         self._setup_aws_client()
+        # One event loop for the service lifetime, running on its own thread;
+        # asyncio.run() would build and tear down a fresh loop for every
+        # transcription, and a running loop can also host background work
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = create_daemon_thread(self._loop.run_forever, name="AWS-Transcribe-Loop")
+        self._loop_thread.start()
+        # int16 PCM scratch, grown to the longest clip seen and reused
+        self._pcm_scratch = np.empty(0, dtype=np.int16)
     
     def _setup_aws_client(self):
         """Initialize AWS Transcribe streaming client"""
+        # Reuse the region's client: building one resolves credentials
+        # through a fresh boto3 session every time
+        client = _aws_client_cache.get(self.region_name)
+        if client is not None:
+            self.transcribe_client = client
+            return
+
         try:
             import boto3
-            import os
             from amazon_transcribe.client import TranscribeStreamingClient
             
             # Get AWS credentials from boto3 session (respects AWS_PROFILE and credentials file)
@@ -243,52 +401,15 @@ class AWSTranscriptionService(TranscriptionService):
             
             print("🔵 AWS TRANSCRIBE SERVICE: AWS credentials loaded successfully")
             
-            # Store credentials securely without exposing them in environment
-            # Pass credentials directly to the client instead of using environment variables
-            self.aws_credentials = {
-                'access_key': credentials.access_key,
-                'secret_key': credentials.secret_key,
-                'session_token': credentials.token if credentials.token else None
-            }
-            
-            # Initialize TranscribeStreamingClient with explicit credentials
-            # Note: This may require modification based on amazon-transcribe library API
-            try:
-                self.transcribe_client = TranscribeStreamingClient(
-                    region=self.region_name,
-                    aws_access_key_id=credentials.access_key,
-                    aws_secret_access_key=credentials.secret_key,
-                    aws_session_token=credentials.token
-                )
-            except TypeError:
-                # Fallback: Use environment variables temporarily only for this process
-                # Set them right before client creation and clear afterwards
-                original_env = {}
-                env_keys = ['AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_SESSION_TOKEN', 'AWS_DEFAULT_REGION']
-                
-                # Backup original environment
-                for key in env_keys:
-                    if key in os.environ:
-                        original_env[key] = os.environ[key]
-                
-                # Set credentials temporarily
-                os.environ['AWS_ACCESS_KEY_ID'] = credentials.access_key
-                os.environ['AWS_SECRET_ACCESS_KEY'] = credentials.secret_key
-                if credentials.token:
-                    os.environ['AWS_SESSION_TOKEN'] = credentials.token
-                os.environ['AWS_DEFAULT_REGION'] = self.region_name
-                
-                try:
-                    self.transcribe_client = TranscribeStreamingClient(region=self.region_name)
-                finally:
-                    # Clear AWS credentials from environment immediately
-                    for key in ['AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_SESSION_TOKEN']:
-                        if key in os.environ:
-                            del os.environ[key]
-                    
-                    # Restore original environment
-                    for key, value in original_env.items():
-                        os.environ[key] = value
+            # Pass credentials straight to the client through a resolver that
+            # re-reads the session, never through os.environ (process-global,
+            # visible to other threads)
+            credential_resolver = _session_credential_resolver(session)
+            self.transcribe_client = TranscribeStreamingClient(
+                region=self.region_name,
+                credential_resolver=credential_resolver
+            )
+            _aws_client_cache[self.region_name] = self.transcribe_client
             print(f"🔵 AWS TRANSCRIBE SERVICE: Initialized with region {self.region_name}")
             
         except ImportError as e:
@@ -303,48 +424,81 @@ class AWSTranscriptionService(TranscriptionService):
     
     def transcribe(self, audio_data, language=None):
         """Transcribe using AWS Transcribe streaming API"""
-        print("Starting AWS transcription...")
+        logger.debug("Starting AWS transcription")
         try:
-            import asyncio
-            import numpy as np
-            
-            # Convert float32 audio to int16 PCM bytes
-            audio_int16 = (audio_data * 32767).astype(np.int16)
-            audio_bytes = audio_int16.tobytes()
-            
-            # Run async transcription
-            text = asyncio.run(self._transcribe_streaming(audio_bytes, language))
-            print(f"AWS transcription completed: '{text}'")
+            # Run async transcription (PCM conversion happens in there, while
+            # the stream is being opened)
+            future = asyncio.run_coroutine_threadsafe(
+                self._transcribe_streaming(audio_data, language), self._loop
+            )
+            try:
+                # Stream handling itself gives up after 10s; allow for setup
+                text = future.result(timeout=self.TRANSCRIBE_TIMEOUT)
+            except TimeoutError:
+                future.cancel()
+                raise
+            logger.debug("AWS transcription completed: %r", text)
             self.type_text(text)
             return text
                     
         except Exception as e:
-            print(f"AWS transcription error: {e}")
+            logger.error("AWS transcription error: %s", e)
             return ""
     
-    async def _transcribe_streaming(self, audio_bytes, language=None):
-        """Transcribe audio using AWS Transcribe streaming"""
+    def _to_pcm_bytes(self, audio_data):
+        """
+        Convert float audio to 16-bit PCM in the reused scratch buffer
+
+        Args:
+            audio_data: Float audio samples, nominally in [-1, 1]
+
+        Returns:
+            memoryview: Byte view of the int16 samples (valid until the next call)
+        """
+        # Convert straight into the reused int16 scratch (no allocation)
+        audio_data = np.asarray(audio_data, dtype=np.float32).ravel()
+        if self._pcm_scratch.size < audio_data.size:
+            self._pcm_scratch = np.empty(audio_data.size, dtype=np.int16)
+        audio_int16 = float_to_pcm16(audio_data, out=self._pcm_scratch[:audio_data.size])
+        # Byte view of the samples: chunks are cut from it directly, with
+        # no full-length tobytes() copy first
+        return memoryview(audio_int16).cast('B')
+    
+    async def _transcribe_streaming(self, audio_data, language=None):
+        """
+        Transcribe audio using AWS Transcribe streaming
+
+        Args:
+            audio_data: Float audio samples (16kHz mono)
+            language: Optional Whisper language code
+        """
         try:
-            import asyncio
             from amazon_transcribe.handlers import TranscriptResultStreamHandler
             from amazon_transcribe.model import TranscriptEvent
-            import io
             
-            language_code = self._map_language_code(language) if language else 'en-US'
+            language_code = self._map_language_code(language) if language else self.DEFAULT_LANGUAGE_CODE
+            
+            # Convert to PCM on a worker thread (NumPy releases the GIL) while
+            # the stream handshake is in flight, instead of before it
+            pcm_future = asyncio.get_running_loop().run_in_executor(None, self._to_pcm_bytes, audio_data)
             
             # Start transcription stream first
-            stream = await self.transcribe_client.start_stream_transcription(
-                language_code=language_code,
-                media_sample_rate_hz=16000,
-                media_encoding='pcm'
-            )
+            sample_rate_hz = 16000
+            try:
+                stream = await self.transcribe_client.start_stream_transcription(
+                    language_code=language_code,
+                    media_sample_rate_hz=sample_rate_hz,
+                    media_encoding='pcm'
+                )
+            finally:
+                audio_bytes = await pcm_future
             
             # Create a simple handler to collect results with the required stream parameter
             class SimpleHandler(TranscriptResultStreamHandler):
                 def __init__(self, transcript_result_stream):
                     super().__init__(transcript_result_stream)
+                    # Joined once at the end; re-joining on every event is quadratic
                     self.transcript_parts = []
-                    self.final_transcript = ""
                 
                 async def handle_transcript_event(self, transcript_event: TranscriptEvent):
                     results = transcript_event.transcript.results
@@ -352,18 +506,21 @@ class AWSTranscriptionService(TranscriptionService):
                         if not result.is_partial:
                             for alt in result.alternatives:
                                 self.transcript_parts.append(alt.transcript)
-                                self.final_transcript = " ".join(self.transcript_parts)
             
             handler = SimpleHandler(stream.output_stream)
             
             # Create audio stream generator
             async def audio_generator():
-                # Send audio in chunks
-                chunk_size = 1024 * 2  # 2KB chunks
+                # Send audio in chunks. The audio is already fully recorded, so
+                # there is no pacing delay; awaiting each send already yields
+                # to the result handler task.
+                # 200 ms (6.4 KB) per audio event, the top of AWS's recommended
+                # 50-200 ms range: the fewest event encodings and sends the
+                # service accepts without risking oversized frames
+                chunk_size = int(sample_rate_hz * 0.2) * 2  # 16-bit mono PCM
                 for i in range(0, len(audio_bytes), chunk_size):
-                    chunk = audio_bytes[i:i + chunk_size]
-                    yield chunk
-                    await asyncio.sleep(0.01)  # Small delay to simulate streaming
+                    # One bytes object per event (the SDK's payload type)
+                    yield bytes(audio_bytes[i:i + chunk_size])
             
             # Send audio and handle results
             async def send_audio():
@@ -377,7 +534,7 @@ class AWSTranscriptionService(TranscriptionService):
                     async for event in stream.output_stream:
                         await handler.handle_transcript_event(event)
                 except Exception as e:
-                    print(f"🔴 Stream handling error: {e}")
+                    logger.warning("Stream handling error: %s", e)
             
             handler_task = asyncio.create_task(handle_stream())
             
@@ -388,35 +545,29 @@ class AWSTranscriptionService(TranscriptionService):
             try:
                 await asyncio.wait_for(handler_task, timeout=10.0)
             except asyncio.TimeoutError:
-                print("🟡 Stream handling timed out after 10 seconds")
+                logger.warning("Stream handling timed out after 10 seconds")
                 handler_task.cancel()
                 try:
                     await handler_task
                 except asyncio.CancelledError:
                     pass
             
-            return handler.final_transcript.strip()
+            return " ".join(handler.transcript_parts).strip()
             
         except Exception as e:
-            print(f"Error in streaming transcription: {e}")
+            logger.error("Error in streaming transcription: %s", e)
             return ""
     
     def _map_language_code(self, whisper_lang):
         """Map Whisper language codes to AWS Transcribe language codes"""
-        mapping = {
-            'en': 'en-US',
-            'es': 'es-US',
-            'fr': 'fr-FR',
-            'de': 'de-DE',
-            'it': 'it-IT',
-            'pt': 'pt-BR',
-            'ja': 'ja-JP',
-            'ko': 'ko-KR',
-            'zh': 'zh-CN'
-        }
-        return mapping.get(whisper_lang, 'en-US')
+        return self.LANGUAGE_CODES.get(whisper_lang, self.DEFAULT_LANGUAGE_CODE)
     
     def cleanup(self):
         """Clean up AWS resources"""
-        # AWS streaming clients don't require explicit cleanup
-        pass
\ No newline at end of file
+        # AWS streaming clients don't require explicit cleanup; only our event loop
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=5)
+        if not self._loop.is_running():
+            self._loop.close()
@@ -27,13 +27,22 @@ Note:
         cmake -B build -DGGML_METAL=ON && cmake --build build -j
 """
 
+import hashlib
+import logging
 import subprocess
 import tempfile
 import os
+import threading
+import time
 import wave
+from collections import OrderedDict
 import numpy as np
 from pathlib import Path
-from .transcription_base import TranscriptionService
+from .transcription_base import TranscriptionService, float_to_pcm16
+from ..config import CONFIG
+from ..utils.process import create_daemon_thread
+
+logger = logging.getLogger(__name__)
 
 
 class WhisperCppWrapper(TranscriptionService):
@@ -47,7 +56,17 @@ class WhisperCppWrapper(TranscriptionService):
     - Optimized GGML Metal shaders
     """
 
-    def __init__(self, model, language, config=None, **kwargs):
+    # RMS below this (~-60 dBFS) is treated as silence and never sent to the model
+    SILENCE_RMS_THRESHOLD = 0.001
+
+    # Recent transcripts kept by audio hash (RealtimeSTT re-submits identical buffers)
+    RESULT_CACHE_SIZE = 32
+
+    # Whisper's encoder covers 30s of audio with 1500 frames (50 per second)
+    ENCODER_FRAMES_PER_SECOND = 50
+    MAX_AUDIO_CTX = 1500
+
+    def __init__(self, model, language, config=None, warmup=True, **kwargs):
         """
         Initialize whisper.cpp wrapper
 
@@ -56,6 +75,7 @@ class WhisperCppWrapper(TranscriptionService):
                   Can also specify quantized models: medium-q5_0, medium-q4_0
             language: Language code (en, es, fr, etc.)
             config: Configuration dict with all settings
+            warmup: Whether to run a silent warmup transcription (non-blocking)
         """
         super().__init__()
         
@@ -67,6 +87,14 @@ class WhisperCppWrapper(TranscriptionService):
             self.model_name = model
             self.language = language
 
+        whispercpp_settings = CONFIG.get("whispercpp_settings", {})
+        self.trim_audio_ctx = whispercpp_settings.get("trim_audio_ctx", False)
+        self.preferred_quantization = whispercpp_settings.get("preferred_quantization")
+
+        # LRU of (audio digest, beam size) -> transcript
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+
         # Locate whisper.cpp installation
         self.whisper_dir = Path(__file__).parent.parent.parent.parent / "whisper.cpp"
         self.binary_path = self.whisper_dir / "build" / "bin" / "whisper-cli"
@@ -87,12 +115,82 @@ class WhisperCppWrapper(TranscriptionService):
                 f"Download with: cd {self.whisper_dir}/models && bash download-ggml-model.sh {self.model_name.split('-')[0]}"
             )
 
-        print(f"🎙️ whisper.cpp initialized with {self.model_name} model (Metal GPU acceleration)")
+        print(f"🎙️ whisper.cpp initialized with {self.model_path.name} (Metal GPU acceleration)")
+
+        # The warmup competes with real transcriptions for the same model and
+        # GPU, so the first real request cancels it (or stops it starting)
+        self._warmup_process = None
+        self._warmup_lock = threading.Lock()
+        self._warmup_cancelled = False
+        if warmup:
+            create_daemon_thread(self._warmup, name="whispercpp-warmup").start()
+
+    def _warmup(self):
+        """
+        Run one transcription of silence so the first real one is fast.
+
+        The first whisper.cpp run pays for reading the model from disk and
+        building the Metal pipelines; later runs hit the OS page cache and
+        the compiled shader cache instead.
+        """
+        start_time = time.time()
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_wav:
+            wav_path = temp_wav.name
+
+        try:
+            self._save_audio_as_wav(np.zeros(16000, dtype=np.float32), wav_path)
+            with self._warmup_lock:
+                if self._warmup_cancelled:
+                    return
+                self._warmup_process = subprocess.Popen(
+                    [
+                        str(self.binary_path),
+                        "-m", str(self.model_path),
+                        "-l", self.language,
+                        "-f", wav_path,
+                        "--no-timestamps",
+                        "--no-prints",
+                    ],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+            try:
+                self._warmup_process.wait(timeout=60)
+            except subprocess.TimeoutExpired:
+                self._warmup_process.kill()
+                raise
+            if self._warmup_process.returncode != 0 and self._warmup_cancelled:
+                print("🔥 whisper.cpp warmup skipped: a transcription arrived first")
+            else:
+                print(f"🔥 whisper.cpp warmup done in {time.time() - start_time:.2f}s")
+        except Exception as e:
+            print(f"⚠️ whisper.cpp warmup failed: {e}")
+        finally:
+            try:
+                os.unlink(wav_path)
+            except Exception:
+                pass
+
+    def _cancel_warmup(self):
+        """Stop a still-running warmup so it doesn't slow a real transcription"""
+        with self._warmup_lock:
+            self._warmup_cancelled = True
+            process = self._warmup_process
+        if process is not None and process.poll() is None:
+            process.kill()
 
     def _resolve_model_path(self):
         """Resolve model file path, checking for quantized variants"""
         models_dir = self.whisper_dir / "models"
         
+        # Prefer a downloaded quantized variant of an unquantized model name:
+        # ~2x less memory bandwidth per token for a negligible accuracy cost
+        if self.preferred_quantization and '-q' not in self.model_name:
+            model_file = models_dir / f"ggml-{self.model_name}-{self.preferred_quantization}.bin"
+            if model_file.exists():
+                print(f"🎙️ Using quantized {model_file.name} in place of ggml-{self.model_name}.bin (preferred_quantization)")
+                return model_file
+
         # Try exact model name first
         model_file = models_dir / f"ggml-{self.model_name}.bin"
         if model_file.exists():
@@ -107,7 +205,7 @@ class WhisperCppWrapper(TranscriptionService):
         # Return expected path for error message
         return models_dir / f"ggml-{self.model_name}.bin"
 
-    def transcribe(self, audio_data=None):
+    def transcribe(self, audio_data=None, beam_size=None):
         """
         Transcribe audio using whisper.cpp binary with Metal GPU acceleration.
         
@@ -121,6 +219,7 @@ class WhisperCppWrapper(TranscriptionService):
         Args:
             audio_data: NumPy float32 array of audio samples (16kHz, mono)
                        Typically provided by RealtimeSTT after VAD/wake word detection
+            beam_size: Decoder beam size (1 = greedy); None keeps whisper.cpp's default
         
         Returns:
             str: Transcribed text with special tokens removed ([_EOT_], [_BEG_], etc.)
@@ -134,7 +233,9 @@ class WhisperCppWrapper(TranscriptionService):
             - Metal GPU automatically detected and used
             - Quantized models (Q5_0) are 20-30% faster
         """
-        print("🎙️ Starting whisper.cpp transcription...")
+        # Per-call progress goes to debug logging: in real-time mode this runs
+        # for every partial update, and unconditional prints add up
+        logger.debug("Starting whisper.cpp transcription")
         
         # ====================================================================
         # STEP 1: Create temporary WAV file
@@ -150,6 +251,23 @@ class WhisperCppWrapper(TranscriptionService):
             if audio_data is None:
                 raise ValueError("Audio data required for whisper.cpp transcription")
             
+            # Cheap energy check first: silence would cost a full model run
+            # only to come back empty (or as a hallucinated phrase)
+            if self._is_silent(audio_data):
+                logger.debug("Skipping whisper.cpp transcription of silent audio")
+                return ""
+            
+            # Identical audio was just transcribed - reuse that result
+            cache_key = (self._audio_digest(audio_data), beam_size)
+            cached_text = self._get_cached_result(cache_key)
+            if cached_text is not None:
+                logger.debug("Reusing transcription of identical audio: %r", cached_text)
+                return cached_text
+            
+            # A real request outranks the warmup; the page cache it filled so far is kept
+            if not self._warmup_cancelled:
+                self._cancel_warmup()
+            
             # ================================================================
             # STEP 3: Convert NumPy array → WAV file
             # ================================================================
@@ -159,16 +277,23 @@ class WhisperCppWrapper(TranscriptionService):
             # ================================================================
             # STEP 4: Execute whisper.cpp binary
             # ================================================================
+            command = [
+                str(self.binary_path),      # Path to whisper-cli binary
+                "-m", str(self.model_path), # Model file (ggml-medium.bin)
+                "-l", self.language,        # Language code (en, es, fr, etc.)
+                "-f", wav_path,             # Input WAV file
+                "--no-timestamps",          # Disable [00:00:00 --> 00:00:05] output
+                "--print-special", "false", # Disable special tokens in output
+                "--no-prints",              # Reduce verbose output
+            ]
+            if beam_size is not None:
+                command += ["-bs", str(beam_size)]  # 1 = greedy decoding (fastest)
+            audio_ctx = self._audio_ctx_for(len(audio_data))
+            if audio_ctx:
+                command += ["-ac", str(audio_ctx)]  # Encode only the clip, not 30s of padding
+
             result = subprocess.run(
-                [
-                    str(self.binary_path),      # Path to whisper-cli binary
-                    "-m", str(self.model_path), # Model file (ggml-medium.bin)
-                    "-l", self.language,        # Language code (en, es, fr, etc.)
-                    "-f", wav_path,             # Input WAV file
-                    "--no-timestamps",          # Disable [00:00:00 --> 00:00:05] output
-                    "--print-special", "false", # Disable special tokens in output
-                    "--no-prints",              # Reduce verbose output
-                ],
+                command,
                 capture_output=True,  # Capture stdout/stderr
                 text=True,            # Return strings instead of bytes
                 timeout=30            # Fail if transcription takes > 30 seconds
@@ -185,8 +310,9 @@ class WhisperCppWrapper(TranscriptionService):
             # STEP 6: Extract and clean transcribed text
             # ================================================================
             text = self._extract_text(result.stdout)
-            print(f"✅ Transcription completed: '{text}'")
+            logger.debug("Transcription completed: %r", text)
             
+            self._cache_result(cache_key, text)
             return text
             
         except subprocess.TimeoutExpired:
@@ -204,26 +330,69 @@ class WhisperCppWrapper(TranscriptionService):
             except Exception:
                 pass  # Ignore cleanup errors
 
+    def _audio_ctx_for(self, num_samples, sample_rate=16000):
+        """
+        Encoder context size covering a clip, or None to use the full window.
+
+        Whisper pads every input to 30 seconds, so a 3 second clip spends
+        90% of encoder work on silence. Sizing the context to the clip
+        (plus one second of margin) skips that padding.
+
+        Opt-in via whispercpp_settings["trim_audio_ctx"]: the model was
+        trained on full 30s windows, so a truncated context trades some
+        accuracy (and a risk of hallucinated text) for the speedup.
+        """
+        if not self.trim_audio_ctx:
+            return None
+        seconds = num_samples / sample_rate + 1.0
+        audio_ctx = int(seconds * self.ENCODER_FRAMES_PER_SECOND)
+        if audio_ctx >= self.MAX_AUDIO_CTX:
+            return None
+        return audio_ctx
+
+    def _audio_digest(self, audio_data):
+        """Hash audio samples (float32 view of the buffer, no conversion copy if already float32)"""
+        samples = np.ascontiguousarray(audio_data, dtype=np.float32)
+        return hashlib.blake2b(samples, digest_size=16).digest()
+
+    def _get_cached_result(self, cache_key):
+        """Look up a cached transcript, marking it most recently used"""
+        with self._result_cache_lock:
+            text = self._result_cache.get(cache_key)
+            if text is not None:
+                self._result_cache.move_to_end(cache_key)
+            return text
+
+    def _cache_result(self, cache_key, text):
+        """Store a transcript, evicting the least recently used beyond the cache size"""
+        with self._result_cache_lock:
+            self._result_cache[cache_key] = text
+            self._result_cache.move_to_end(cache_key)
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+    def _is_silent(self, audio_data):
+        """Check whether audio RMS is below the silence threshold"""
+        samples = np.asarray(audio_data, dtype=np.float32)
+        if not samples.size:
+            return True
+        rms = np.sqrt(np.dot(samples, samples) / samples.size)
+        return rms < self.SILENCE_RMS_THRESHOLD
+
     def _save_audio_as_wav(self, audio_data, wav_path, sample_rate=16000):
         """Save numpy audio array as WAV file for whisper.cpp"""
-        # Ensure audio is float32
-        if audio_data.dtype != np.float32:
-            audio_data = audio_data.astype(np.float32)
-        
-        # Normalize to [-1, 1] if needed
-        max_val = np.abs(audio_data).max()
-        if max_val > 1.0:
-            audio_data = audio_data / max_val
-        
-        # Convert to int16 PCM
-        audio_int16 = (audio_data * 32767).astype(np.int16)
+        # Convert to int16 PCM in one pass (peak-normalized if louder than [-1, 1])
+        audio_int16 = float_to_pcm16(audio_data)
         
         # Write WAV file
         with wave.open(wav_path, 'wb') as wav_file:
             wav_file.setnchannels(1)  # Mono
             wav_file.setsampwidth(2)  # 16-bit
             wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_int16.tobytes())
+            # Known frame count: the header is written once, never patched on close
+            wav_file.setnframes(len(audio_int16))
+            # wave accepts any buffer, so the samples are written without a tobytes() copy
+            wav_file.writeframes(audio_int16)
 
     def _extract_text(self, stdout):
         """Extract transcribed text from whisper.cpp output"""
@@ -305,12 +474,15 @@ class WhisperCppRealtimeWrapper:
     def __init__(self, model, language, config=None, **kwargs):
         """Initialize whisper.cpp backend with RealtimeSTT compatibility"""
         self.backend = WhisperCppWrapper(model, language, config, **kwargs)
-        self._audio_buffer = []
         self._sample_rate = 16000
+        # Preallocated float32 buffer (grows by doubling) filled in place, so
+        # adding chunks never allocates and transcribe() needs no concatenate
+        self._audio_buffer = np.empty(self._sample_rate * 30, dtype=np.float32)
+        self._audio_length = 0
         
     def start(self):
         """Start audio capture (handled by RealtimeSTT)"""
-        self._audio_buffer = []
+        self._audio_length = 0
     
     def stop(self):
         """Stop audio capture and prepare for transcription"""
@@ -323,7 +495,14 @@ class WhisperCppRealtimeWrapper:
         Args:
             audio_chunk: numpy float32 audio data
         """
-        self._audio_buffer.append(audio_chunk)
+        end = self._audio_length + len(audio_chunk)
+        if end > len(self._audio_buffer):
+            grown = np.empty(max(end, 2 * len(self._audio_buffer)), dtype=np.float32)
+            grown[:self._audio_length] = self._audio_buffer[:self._audio_length]
+            self._audio_buffer = grown
+        
+        self._audio_buffer[self._audio_length:end] = audio_chunk
+        self._audio_length = end
     
     def transcribe(self):
         """
@@ -332,17 +511,17 @@ class WhisperCppRealtimeWrapper:
         Returns:
             str: Transcribed text
         """
-        if not self._audio_buffer:
+        if not self._audio_length:
             return ""
         
-        # Concatenate all audio chunks
-        audio_data = np.concatenate(self._audio_buffer)
+        # View of the filled part of the buffer (no copy)
+        audio_data = self._audio_buffer[:self._audio_length]
         
         # Transcribe using whisper.cpp
         text = self.backend.transcribe(audio_data)
         
-        # Clear buffer
-        self._audio_buffer = []
+        # Reset buffer (storage is reused for the next recording)
+        self._audio_length = 0
         
         return text
     
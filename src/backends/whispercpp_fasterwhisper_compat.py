@@ -46,6 +46,23 @@ import numpy as np
 from pathlib import Path
 from .whispercpp_backend import WhisperCppWrapper
 
+# whisper.cpp backends by model name, shared by every WhisperModelCompat
+# (RealtimeSTT builds separate main/realtime/batched models, often the same one)
+_backend_cache = {}
+
+
+def _get_backend(model_name):
+    """Get or create the whisper.cpp backend for a model name"""
+    backend = _backend_cache.get(model_name)
+    if backend is None:
+        backend = WhisperCppWrapper(
+            model=model_name,
+            language="en",  # Default language, can be overridden in transcribe()
+            config=None     # No additional config needed
+        )
+        _backend_cache[model_name] = backend
+    return backend
+
 
 class WhisperModelCompat:
     """
@@ -105,13 +122,10 @@ class WhisperModelCompat:
             model_name = "medium"
 
         # ====================================================================
-        # STEP 2: Initialize whisper.cpp backend
+        # STEP 2: Initialize whisper.cpp backend (shared per model, so path
+        # checks and warmup run once no matter how many models RealtimeSTT builds)
         # ====================================================================
-        self.backend = WhisperCppWrapper(
-            model=model_name,
-            language="en",  # Default language, can be overridden in transcribe()
-            config=None     # No additional config needed
-        )
+        self.backend = _get_backend(model_name)
 
         print(f"✅ Patched faster-whisper → whisper.cpp ({model_name})")
 
@@ -119,7 +133,7 @@ class WhisperModelCompat:
         self,
         audio,
         language=None,
-        beam_size=5,           # Ignored - whisper.cpp uses greedy decoding
+        beam_size=5,           # Passed to whisper.cpp (-bs); 1 = greedy decoding
         initial_prompt=None,   # Ignored - not supported by whisper.cpp
         suppress_tokens=None,  # Ignored - not supported by whisper.cpp
         vad_filter=False,      # Ignored - VAD handled by RealtimeSTT
@@ -129,14 +143,15 @@ class WhisperModelCompat:
         Transcribe audio using whisper.cpp (mimics faster-whisper API).
         
         This method accepts all faster_whisper.WhisperModel.transcribe() parameters
-        for API compatibility, but only uses audio and language. Other parameters
-        (beam_size, initial_prompt, etc.) are ignored since whisper.cpp doesn't
+        for API compatibility, but only uses audio, language and beam_size. Other
+        parameters (initial_prompt, etc.) are ignored since whisper.cpp doesn't
         support them or handles them differently.
 
         Args:
             audio: NumPy array of audio data (float32, 16kHz sample rate)
             language: Language code (en, es, fr, etc.) - overrides default
-            beam_size: Ignored (whisper.cpp uses greedy decoding for speed)
+            beam_size: Decoder beam size; RealtimeSTT passes a small one for
+                       real-time updates and a larger one for final transcription
             initial_prompt: Ignored (whisper.cpp doesn't support prompting)
             suppress_tokens: Ignored (whisper.cpp handles this internally)
             vad_filter: Ignored (VAD is handled upstream by RealtimeSTT)
@@ -151,21 +166,23 @@ class WhisperModelCompat:
         # STEP 1: Ensure audio is in correct format (NumPy float32)
         # ====================================================================
         if not isinstance(audio, np.ndarray):
-            audio = np.array(audio, dtype=np.float32)
+            audio = np.asarray(audio, dtype=np.float32)
 
         # ====================================================================
         # STEP 2: Call whisper.cpp to transcribe
         # ====================================================================
         # This writes audio to temp WAV file, calls whisper.cpp binary,
         # parses output, and returns cleaned text
-        transcribed_text = self.backend.transcribe(audio)
+        transcribed_text = self.backend.transcribe(audio, beam_size=beam_size)
 
         # ====================================================================
         # STEP 3: Wrap result in faster-whisper compatible objects
         # ====================================================================
         # RealtimeSTT expects (segments, info) tuple from faster_whisper
-        segments = [FakeSegment(transcribed_text)]
-        info = FakeTranscriptionInfo(language=language or "en")
+        # Duration comes straight from the sample count (16kHz), no decoding
+        duration = len(audio) / 16000
+        segments = [FakeSegment(transcribed_text, end=duration)]
+        info = FakeTranscriptionInfo(language=language or "en", duration=duration)
 
         return segments, info
 
@@ -176,18 +193,21 @@ class FakeSegment:
     
     RealtimeSTT expects segments with text, start, end, and no_speech_prob
     attributes. Since whisper.cpp returns plain text without timestamps,
-    we provide dummy values for the timing fields.
+    the single segment spans the whole audio clip.
     
     Attributes:
         text: Transcribed text (actual value from whisper.cpp)
-        start: Start time in seconds (always 0.0 - not available from whisper.cpp)
-        end: End time in seconds (always 0.0 - not available from whisper.cpp)  
+        start: Start time in seconds (always 0.0 - start of the clip)
+        end: End time in seconds (length of the clip)
         no_speech_prob: Probability of no speech (always 0.0 - not calculated)
     """
-    def __init__(self, text):
+    # Built for every transcription; slots skip the per-instance __dict__
+    __slots__ = ('text', 'start', 'end', 'no_speech_prob')
+
+    def __init__(self, text, end=0.0):
         self.text = text              # Actual transcription
-        self.start = 0.0              # Dummy value (timestamps not available)
-        self.end = 0.0                # Dummy value (timestamps not available)
+        self.start = 0.0              # Segment starts with the clip
+        self.end = end                # Segment ends with the clip
         self.no_speech_prob = 0.0     # Dummy value (not calculated)
 
 
@@ -196,18 +216,20 @@ class FakeTranscriptionInfo:
     Emulates faster_whisper.TranscriptionInfo for API compatibility.
     
     RealtimeSTT expects transcription info with language, probability, and
-    duration. Since whisper.cpp doesn't provide these metrics, we return
-    dummy values that indicate successful transcription.
+    duration. whisper.cpp doesn't report language confidence, so that is a
+    dummy value; duration is derived from the sample count.
     
     Attributes:
         language: Detected language code (passed from transcribe() call)
         language_probability: Confidence (always 1.0 - not calculated by whisper.cpp)
-        duration: Audio duration (always 0.0 - not calculated by whisper.cpp)
+        duration: Audio duration in seconds (sample count / 16kHz)
     """
-    def __init__(self, language):
+    __slots__ = ('language', 'language_probability', 'duration')
+
+    def __init__(self, language, duration=0.0):
         self.language = language            # Language from transcribe() parameter
         self.language_probability = 1.0     # Dummy confidence (100%)
-        self.duration = 0.0                 # Dummy duration (not calculated)
+        self.duration = duration            # Seconds of audio transcribed
 
 
 def patch_realtimestt():
@@ -92,6 +92,21 @@ CONFIG = {
         "vad_sensitivity": 0.3,                    # Voice activity detection sensitivity
         "post_speech_silence_duration": 0.7,       # Seconds of silence before auto-stop
         "webrtc_sensitivity": 2,                   # Alternative VAD method sensitivity
+    },
+
+    # ========================================================================
+    # WHISPER.CPP SETTINGS
+    # ========================================================================
+    # Inference tuning for the whisper.cpp backend (direct or via RealtimeSTT patch)
+    # ========================================================================
+    "whispercpp_settings": {
+        # Opt-in speed/accuracy trade-off: sizing the encoder window (-ac) to
+        # the clip skips the 30s padding, but whisper was trained on full
+        # windows and a shortened context can cost accuracy or hallucinate
+        "trim_audio_ctx": False,                   # Size encoder window to clip length (<30s clips)
+        # Opt-in: e.g. "q8_0" uses ggml-<model>-q8_0.bin instead of the
+        # configured full-precision model when that file is downloaded
+        "preferred_quantization": None,
     }
 }
 
@@ -4,18 +4,32 @@ Uses PyQt6 for proper floating window without dock icon on macOS
 """
 
 from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QGraphicsBlurEffect
-from PyQt6.QtCore import Qt, QTimer, QRectF, QPointF, pyqtSignal
-from PyQt6.QtGui import QPainter, QLinearGradient, QColor, QFont, QPen, QBrush, QPixmap
+from PyQt6.QtCore import Qt, QTimer, QRectF, QPointF, QThread, QEventLoop
+from PyQt6.QtGui import QPainter, QLinearGradient, QColor, QFont, QPen, QBrush, QPixmap, QCursor
 from ctypes import c_void_p
 import sys
 import time
 import random
 import math
 import threading
+from collections import deque
 from typing import Optional, Callable
 from datetime import timedelta
 
 
+def get_qt_application() -> QApplication:
+    """
+    Get the process-wide QApplication, creating it on first use
+
+    Creating a QApplication loads the font database and platform plugin, and
+    Qt allows only one per process, so every popup and test script shares it.
+
+    Returns:
+        The existing or newly created QApplication
+    """
+    return QApplication.instance() or QApplication(sys.argv)
+
+
 class RecordingPopup(QWidget):
     """
     A recording popup using PyQt6 with:
@@ -27,9 +41,6 @@ class RecordingPopup(QWidget):
     - No dock icon on macOS
     """
 
-    # Signal for thread-safe audio level updates
-    audio_level_signal = pyqtSignal(float)
-
     def __init__(self, on_stop_callback: Optional[Callable] = None, on_cancel_callback: Optional[Callable] = None):
         """
         Initialize the recording popup
@@ -39,10 +50,7 @@ class RecordingPopup(QWidget):
             on_cancel_callback: Function to call when cancelled
         """
         # Ensure QApplication exists
-        if not QApplication.instance():
-            self.app = QApplication(sys.argv)
-        else:
-            self.app = QApplication.instance()
+        self.app = get_qt_application()
 
         super().__init__()
 
@@ -53,26 +61,39 @@ class RecordingPopup(QWidget):
 
         # Recording state
         self.start_time = None
+        self._timer_pixmap: Optional[QPixmap] = None
+        self._timer_pixmap_origin: Optional[QPointF] = None
+        self._timer_pixmap_key = None
+        self._layout = None  # Cached (content, waveform, timer) rects; reset on resize
+        self._timer_font: Optional[QFont] = None  # Sized from window height; reset on resize
+        self._background_pixmap: Optional[QPixmap] = None  # Pre-rendered shadows + surface
+        self._background_pixmap_key = None  # (width, height, device pixel ratio) it was rendered for
+        self._waveform_bars = None  # (bar_width, per-bar constants) for the current waveform rect
+        self._waveform_bars_key = None
+        self._random_factors = None  # Per-bar random factors for the current seed
+        self._random_factors_seed = None
 
         # Waveform data and animation
         self.phase = 0.0  # Animation phase for pulsing
-        self.audio_levels = [0.0] * 30  # 30 points for smooth waveform
+        self.phase_velocity = 0.0  # Eased towards a target velocity each frame
+        # 30 points for smooth waveform; appending drops the oldest in place
+        self.audio_levels = deque([0.0] * 30, maxlen=30)
         self.current_level = 0.0
+        self._prev_level: Optional[float] = None  # Last smoothed level, None until first update
         self.level_lock = threading.Lock()
 
-        # Connect signal for thread-safe updates
-        self.audio_level_signal.connect(self._update_audio_level_internal)
+        # Levels pushed from the monitor thread, drained once per animation frame.
+        # Bounded to the waveform length: if the GUI thread falls behind, older
+        # levels would scroll straight out of the waveform anyway
+        self._pending_levels = deque(maxlen=30)
 
         # Setup window
         self._setup_window()
 
-        # Timer for continuous animation (pulsing and waveform)
+        # Timer for continuous animation; each frame repaints the waveform
+        # and the timer text together, so no separate timer-display timer
         self.animation_timer = QTimer()
         self.animation_timer.timeout.connect(self._update_animation)
-        
-        # Timer for timer display
-        self.timer_update = QTimer()
-        self.timer_update.timeout.connect(self._update_timer_display)
 
     def _setup_window(self):
         """Setup window properties for floating popup without dock icon"""
@@ -169,10 +190,10 @@ class RecordingPopup(QWidget):
     def _update_animation(self):
         """Update animation phase for pulsing effects and waveform movement"""
         if self.is_visible and not self.stop_animation:
-            # Simple velocity-based easing without heavy computation
-            if not hasattr(self, 'phase_velocity'):
-                self.phase_velocity = 0.0
-            
+            # Apply audio levels queued since the last frame
+            while self._pending_levels:
+                self._update_audio_level_internal(self._pending_levels.popleft())
+
             # Smooth acceleration with minimal calculation
             target_velocity = 0.02
             self.phase_velocity += (target_velocity - self.phase_velocity) * 0.1
@@ -188,6 +209,14 @@ class RecordingPopup(QWidget):
         self.stop_animation = False
         self.start_time = time.time()
         self.phase = 0.0  # Reset phase for fresh animation
+        self.phase_velocity = 0.0
+
+        # The popup is reused across recordings - start from a flat waveform
+        self._pending_levels.clear()
+        with self.level_lock:
+            self.audio_levels.extend([0.0] * 30)
+            self.current_level = 0.0
+            self._prev_level = None
 
         # ====================================================================
         # CRITICAL: Position on active monitor BEFORE showing
@@ -196,7 +225,6 @@ class RecordingPopup(QWidget):
 
         # Start animations
         self.animation_timer.start(30)  # ~33 FPS for smoother rendering
-        self.timer_update.start(10)  # Update timer every 10ms
 
         # Show window without stealing focus
         super().show()
@@ -212,8 +240,6 @@ class RecordingPopup(QWidget):
         """
         if not self.app:
             return
-            
-        from PyQt6.QtGui import QCursor
         
         # Get current cursor position
         cursor_pos = QCursor.pos()
@@ -236,6 +262,10 @@ class RecordingPopup(QWidget):
             x = screen_rect.x() + (screen_rect.width() - popup_width) // 2
             y = screen_rect.y() + (screen_rect.height() - popup_height) // 2 - 100
             
+            # Same monitor as last time - skip the native window move
+            if self.x() == x and self.y() == y:
+                return
+
             self.move(x, y)
             print(f"📍 Positioned on screen: {screen_rect.width()}x{screen_rect.height()} at ({x}, {y})")
     def hide(self):
@@ -246,9 +276,8 @@ class RecordingPopup(QWidget):
         self.stop_animation = True
         self.is_visible = False
 
-        # Stop timers
+        # Stop animation
         self.animation_timer.stop()
-        self.timer_update.stop()
 
         # Hide window
         super().hide()
@@ -266,6 +295,43 @@ class RecordingPopup(QWidget):
         # Draw glowing neon border around entire popup
         self._draw_neon_border(painter)
 
+        # Layout rects are derived from the window size only; reuse until resized
+        if self._layout is None:
+            self._layout = self._compute_layout()
+        content_rect, waveform_rect, timer_rect = self._layout
+
+        self._draw_waveform(painter, waveform_rect)
+
+        # Draw timer with rounded background
+        if self.start_time:
+            elapsed = time.time() - self.start_time
+            time_str = self._format_time(elapsed)
+        else:
+            time_str = "00:00"  # Fixed default format
+
+        # Timer text with glow, pre-rendered once per displayed value
+        self._draw_timer_text(painter, timer_rect, time_str)
+
+        # Draw microphone icon at bottom center
+        self._draw_microphone_icon(painter, content_rect)
+
+
+
+
+
+    def resizeEvent(self, event):
+        """Invalidate cached layout rects when the popup size changes"""
+        self._layout = None
+        self._timer_font = None
+        super().resizeEvent(event)
+
+    def _compute_layout(self):
+        """
+        Compute content, waveform and timer rects from the current window size
+
+        Returns:
+            Tuple of (content_rect, waveform_rect, timer_rect)
+        """
         # Content area using ratios (5% padding on all sides)
         padding_ratio = 0.05
         content_rect = QRectF(
@@ -283,14 +349,6 @@ class RecordingPopup(QWidget):
             content_rect.width() * 0.8,  # 80% of content width
             content_rect.height() * 0.25  # 25% of content height (ends at 40%)
         )
-        self._draw_waveform(painter, waveform_rect)
-
-        # Draw timer with rounded background
-        if self.start_time:
-            elapsed = time.time() - self.start_time
-            time_str = self._format_time(elapsed)
-        else:
-            time_str = "00:00"  # Fixed default format
 
         # Timer positioning using ratios
         # Timer at 55% from top, centered horizontally
@@ -305,34 +363,87 @@ class RecordingPopup(QWidget):
             timer_width,
             timer_height/2
         )
-        
-        # Timer text with beautiful glow effect
-        timer_font_size = int(self.height() * 0.08)  # 8% of window height
-        timer_font = QFont("Arial", timer_font_size, QFont.Weight.Bold)
-        timer_font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, 2)
-        painter.setFont(timer_font)
-        
-        # Multi-layer glow effect for timer (minimal artist aesthetic)
-        for i in range(4, 0, -1):  # 4 layers from outer to inner
-            glow_alpha = 30 - i * 5  # Subtle glow (25, 20, 15, 10)
-            glow_offset = i * 0.8  # Minimal blur radius
-            painter.setPen(QPen(QColor(100, 160, 255, glow_alpha), glow_offset))
-            painter.drawText(timer_rect, Qt.AlignmentFlag.AlignCenter, time_str)
-        
-        # Main timer text - bright and clean
-        painter.setPen(QPen(QColor(220, 230, 240, 255)))  # Almost white with slight blue
-        painter.drawText(timer_rect, Qt.AlignmentFlag.AlignCenter, time_str)
 
-        # Draw microphone icon at bottom center
-        self._draw_microphone_icon(painter, content_rect)
+        return content_rect, waveform_rect, timer_rect
+
+    def _draw_timer_text(self, painter, timer_rect, time_str):
+        """
+        Draw the glowing timer text from a cached pixmap.
 
+        The five layered drawText passes only run when the displayed time,
+        popup size or screen scale changes; every other frame is a single
+        pixmap blit.
+        """
+        # The popup is reused across monitors, so the scale is part of the key
+        dpr = self.devicePixelRatioF()
+        cache_key = (time_str, self.width(), self.height(), dpr)
+        if self._timer_pixmap_key != cache_key:
+            # Pad the area so tall glyphs overflowing timer_rect are not clipped
+            area = timer_rect.adjusted(
+                -timer_rect.width(), -timer_rect.height() * 2,
+                timer_rect.width(), timer_rect.height() * 2
+            )
+            pixmap = QPixmap(int(area.width() * dpr), int(area.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+
+            text_painter = QPainter(pixmap)
+            text_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            text_painter.translate(-area.x(), -area.y())
+
+            # Timer text with beautiful glow effect
+            if self._timer_font is None:
+                timer_font_size = int(self.height() * 0.08)  # 8% of window height
+                self._timer_font = QFont("Arial", timer_font_size, QFont.Weight.Bold)
+                self._timer_font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, 2)
+            text_painter.setFont(self._timer_font)
+
+            # Multi-layer glow effect for timer (minimal artist aesthetic)
+            for i in range(4, 0, -1):  # 4 layers from outer to inner
+                glow_alpha = 30 - i * 5  # Subtle glow (25, 20, 15, 10)
+                glow_offset = i * 0.8  # Minimal blur radius
+                text_painter.setPen(QPen(QColor(100, 160, 255, glow_alpha), glow_offset))
+                text_painter.drawText(timer_rect, Qt.AlignmentFlag.AlignCenter, time_str)
+
+            # Main timer text - bright and clean
+            text_painter.setPen(QPen(QColor(220, 230, 240, 255)))  # Almost white with slight blue
+            text_painter.drawText(timer_rect, Qt.AlignmentFlag.AlignCenter, time_str)
+            text_painter.end()
+
+            self._timer_pixmap = pixmap
+            self._timer_pixmap_origin = area.topLeft()
+            self._timer_pixmap_key = cache_key
+
+        painter.drawPixmap(self._timer_pixmap_origin, self._timer_pixmap)
 
+    def _draw_frosted_background(self, painter):
+        """
+        Draw the frosted background from a cached pixmap.
 
+        The background only depends on the window size and screen scale, so
+        the shadow layers, gradient surface and border are rendered once (at
+        physical resolution) and blitted each frame.
+        """
+        dpr = self.devicePixelRatioF()
+        cache_key = (self.width(), self.height(), dpr)
+        if self._background_pixmap_key != cache_key:
+            pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
 
+            bg_painter = QPainter(pixmap)
+            bg_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self._render_frosted_background(bg_painter)
+            bg_painter.end()
 
-    def _draw_frosted_background(self, painter):
+            self._background_pixmap = pixmap
+            self._background_pixmap_key = cache_key
+
+        painter.drawPixmap(0, 0, self._background_pixmap)
+
+    def _render_frosted_background(self, painter):
         """
-        Draw glassmorphism background with blur effect and layered shadows
+        Render glassmorphism background with blur effect and layered shadows
         
         Glassmorphism characteristics:
         - High transparency (60-70%)
@@ -413,19 +524,23 @@ class RecordingPopup(QWidget):
         """Skip border - modern design doesn't need it with proper shadow"""
         pass  # Border removed for cleaner look
 
-    def _draw_waveform(self, painter, waveform_rect=None):
-        """Draw symmetric waveform matching reference design"""
-        # Use provided rect or default for backward compatibility
-        if waveform_rect is None:
-            waveform_rect = QRectF(75, 100, 450, 80)
+    def _waveform_bar_table(self, waveform_rect):
+        """
+        Per-bar values that only depend on the waveform rect, computed once
 
-        center_y = waveform_rect.center().y()
+        Args:
+            waveform_rect: Rect the waveform is drawn into
 
-        # Draw waveform bars with clean varied heights
-        with self.level_lock:
-            levels = self.audio_levels[:]
+        Returns:
+            Tuple of (bar_width, bars) where each bar is
+            (x, level_index, base_height, bar_opacity, glow_alphas)
+        """
+        cache_key = (waveform_rect.x(), waveform_rect.y(), waveform_rect.width(), waveform_rect.height())
+        if self._waveform_bars_key == cache_key:
+            return self._waveform_bars
 
         num_bars = 60  # Number of bars
+        num_levels = len(self.audio_levels)
         total_width = waveform_rect.width()
         bar_width = total_width * 0.01  # 1% of waveform width
         spacing = total_width * 0.006  # 0.6% of waveform width
@@ -434,15 +549,12 @@ class RecordingPopup(QWidget):
         total_bars_width = (bar_width + spacing) * num_bars
         start_x = waveform_rect.left() + (total_width - total_bars_width) / 2
 
-        # Modern waveform with sophisticated gradient
-        painter.setPen(Qt.PenStyle.NoPen)  # No outline
-
+        bars = []
         for i in range(num_bars):
             x = start_x + i * (bar_width + spacing)
 
-            # Get interpolated audio level
-            level_index = int((i / num_bars) * len(levels))
-            level = levels[min(level_index, len(levels) - 1)]
+            # Interpolated audio level index
+            level_index = min(int((i / num_bars) * num_levels), num_levels - 1)
 
             # Create tapered structure from center to edges
             distance_from_center = abs(i - num_bars / 2) / (num_bars / 2)
@@ -457,19 +569,71 @@ class RecordingPopup(QWidget):
             else:  # Far edges - dots
                 base_height = 0.05
 
-            # Smooth wave animation
-            wave_pattern = math.sin(i * 0.2 + self.phase * 2.0) * 0.2 + 0.8
+            # Elegant opacity gradient from center to edges
+            center_position = num_bars / 2
+            distance_ratio = abs(i - center_position) / center_position
+            bar_opacity = int(255 * (1.0 - distance_ratio * 0.4))  # 100% center to 60% edges
+
+            # Glow alphas for layers 3..1 (outer to inner)
+            glow_alphas = tuple(
+                (glow_layer, int(bar_opacity * (glow_layer * 0.08)))
+                for glow_layer in range(3, 0, -1)
+            )
+
+            bars.append((x, level_index, base_height, bar_opacity, glow_alphas))
+
+        self._waveform_bars = (bar_width, bars)
+        self._waveform_bars_key = cache_key
+        return self._waveform_bars
+
+    def _waveform_random_factors(self, num_bars):
+        """
+        Per-bar random factors for the organic feel
+
+        The seed only advances every few seconds of animation, so the factors
+        are regenerated when it changes instead of reseeding on every frame.
+        """
+        seed_offset = int(self.phase * 0.3)
+        if self._random_factors_seed != seed_offset:
+            rng = random.Random()
+            factors = []
+            for i in range(num_bars):
+                rng.seed(i * 1337 + seed_offset)
+                factors.append(rng.random() * 0.2 + 0.8)  # 0.8 to 1.0
+            self._random_factors = factors
+            self._random_factors_seed = seed_offset
+        return self._random_factors
+
+    def _draw_waveform(self, painter, waveform_rect=None):
+        """Draw symmetric waveform matching reference design"""
+        # Use provided rect or default for backward compatibility
+        if waveform_rect is None:
+            waveform_rect = QRectF(75, 100, 450, 80)
+
+        center_y = waveform_rect.center().y()
+
+        # Draw waveform bars with clean varied heights
+        with self.level_lock:
+            levels = list(self.audio_levels)
+
+        bar_width, bars = self._waveform_bar_table(waveform_rect)
+        random_factors = self._waveform_random_factors(len(bars))
+
+        # Calculate bar height bounds
+        min_height = waveform_rect.height() * 0.02  # 2% minimum height
+        max_height = waveform_rect.height() * 0.45  # Half height for symmetry
+
+        # Modern waveform with sophisticated gradient
+        painter.setPen(Qt.PenStyle.NoPen)  # No outline
 
-            # Subtle randomness for organic feel
-            random.seed(i * 1337 + int(self.phase * 0.3))
-            random_factor = random.random() * 0.2 + 0.8  # 0.8 to 1.0
+        for i, (x, level_index, base_height, bar_opacity, glow_alphas) in enumerate(bars):
+            level = levels[level_index]
 
-            # Calculate bar height
-            min_height = waveform_rect.height() * 0.02  # 2% minimum height
-            max_height = waveform_rect.height() * 0.45  # Half height for symmetry
+            # Smooth wave animation
+            wave_pattern = math.sin(i * 0.2 + self.phase * 2.0) * 0.2 + 0.8
 
             # Combine factors
-            height_factor = base_height * wave_pattern * random_factor
+            height_factor = base_height * wave_pattern * random_factors[i]
 
             # Gentle breathing effect
             breath = 0.9 + (math.sin(self.phase * 2.0 + i * 0.05) * 0.1)
@@ -486,16 +650,8 @@ class RecordingPopup(QWidget):
             # Ensure minimum visibility
             half_amplitude = max(min_height, min(half_amplitude, max_height))
 
-            # Calculate opacity based on distance from center for sophistication
-            center_position = num_bars / 2
-            distance_ratio = abs(i - center_position) / center_position
-            
-            # Elegant opacity gradient from center to edges
-            bar_opacity = int(255 * (1.0 - distance_ratio * 0.4))  # 100% center to 60% edges
-            
             # Draw glow layers first (outer to inner)
-            for glow_layer in range(3, 0, -1):
-                glow_alpha = int(bar_opacity * (glow_layer * 0.08))  # Subtle glow
+            for glow_layer, glow_alpha in glow_alphas:
                 glow_width = bar_width * (1 + glow_layer * 0.3)
                 glow_height = half_amplitude * (1 + glow_layer * 0.15)
                 
@@ -533,7 +689,6 @@ class RecordingPopup(QWidget):
 
 
 
-
     def _draw_microphone_icon(self, painter, content_rect):
         """Draw microphone icon at bottom center of popup"""
         # Icon position using ratios (87% from top - more space from timer)
@@ -613,11 +768,6 @@ class RecordingPopup(QWidget):
         secs = int(td.total_seconds() % 60)
         return f"{minutes:02d}:{secs:02d}"
 
-    def _update_timer_display(self):
-        """Update timer display (triggers repaint)"""
-        if self.is_visible and not self.stop_animation:
-            self.update()  # Trigger repaint
-
     def update_audio_level(self, level: float):
         """
         Update audio level from any thread
@@ -625,8 +775,8 @@ class RecordingPopup(QWidget):
         Args:
             level: Audio level (0.0 to 1.0)
         """
-        # Emit signal for thread-safe update
-        self.audio_level_signal.emit(level)
+        # deque.append is thread-safe; the animation timer applies it on the Qt thread
+        self._pending_levels.append(level)
 
     def _update_audio_level_internal(self, level: float):
         """
@@ -650,7 +800,7 @@ class RecordingPopup(QWidget):
             enhanced_level = min(1.0, enhanced_level)  # Clamp to max
             
             # Minimal smoothing to keep it snappy and reactive
-            if hasattr(self, '_prev_level'):
+            if self._prev_level is not None:
                 smoothing = 0.15  # Only 15% smoothing = very reactive
                 enhanced_level = self._prev_level * smoothing + enhanced_level * (1 - smoothing)
             
@@ -658,7 +808,7 @@ class RecordingPopup(QWidget):
             self.current_level = enhanced_level
             
             # Shift buffer and add new level
-            self.audio_levels = self.audio_levels[1:] + [self.current_level]
+            self.audio_levels.append(self.current_level)
 
     def is_showing(self) -> bool:
         """Check if popup is currently visible"""
@@ -670,8 +820,7 @@ class RecordingPopup(QWidget):
         event.ignore()
         # Ensure we stay on top
         if self.is_visible:
-            self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, True)
-            super().show()
+            self._ensure_on_top()
 
     def changeEvent(self, event):
         """Override to prevent hiding on deactivation"""
@@ -680,11 +829,19 @@ class RecordingPopup(QWidget):
             event.ignore()
             # Ensure we stay visible and on top
             if self.is_visible:
-                self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, True)
-                super().show()
+                self._ensure_on_top()
         else:
             super().changeEvent(event)
 
+    def _ensure_on_top(self):
+        """Keep the popup shown and on top without redundant native window updates"""
+        # setWindowFlag() recreates the native window even when the flag is
+        # unchanged, so only touch it if something cleared the hint
+        if not self.windowFlags() & Qt.WindowType.WindowStaysOnTopHint:
+            self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, True)
+        if not self.isVisible():
+            super().show()
+
     def mousePressEvent(self, event):
         """Override to prevent focus stealing on click"""
         # Handle the event but don't take focus
@@ -707,6 +864,9 @@ class RecordingPopupManager:
         self.audio_monitor = None
         self.stop_callback = None
         self.cancel_callback = None
+        # Set while no popup is showing, so callers can wait for a close
+        self.closed_event = threading.Event()
+        self.closed_event.set()
 
     def set_callbacks(self, stop_callback: Optional[Callable] = None, cancel_callback: Optional[Callable] = None):
         """Set callbacks for stop and cancel actions"""
@@ -715,28 +875,36 @@ class RecordingPopupManager:
 
     def show_recording_popup(self):
         """Show the recording popup with real-time audio monitoring"""
-        if self.popup and self.popup.is_showing():
+        if self.is_popup_visible():
             return  # Already showing
 
         try:
             # Import audio monitor here to avoid circular imports
             from ..utils.audio_monitor import AudioLevelMonitor
 
-            # Create popup with callbacks
-            self.popup = RecordingPopup(
-                on_stop_callback=self.stop_callback,
-                on_cancel_callback=self.cancel_callback
-            )
+            # Create the popup once and reuse it across recordings; building
+            # the frameless translucent window is the expensive part
+            if self.popup is None:
+                self.popup = RecordingPopup(
+                    on_stop_callback=self.stop_callback,
+                    on_cancel_callback=self.cancel_callback
+                )
+            else:
+                self.popup.on_stop_callback = self.stop_callback
+                self.popup.on_cancel_callback = self.cancel_callback
 
-            # Start audio monitoring in background thread
+            # Start audio monitoring on the Qt event loop once the popup is up,
+            # so it can never race with hide_recording_popup()
             def start_audio_monitoring():
+                if not self.popup.is_showing() or self.audio_monitor is not None:
+                    return
                 self.audio_monitor = AudioLevelMonitor(callback=self.popup.update_audio_level)
                 self.audio_monitor.start_monitoring()
 
-            monitor_thread = threading.Thread(target=start_audio_monitoring, daemon=True)
-            monitor_thread.start()
+            QTimer.singleShot(0, start_audio_monitoring)
 
             # Show the popup
+            self.closed_event.clear()
             self.popup.show()
 
             print("🔴 Recording popup displayed with audio monitoring")
@@ -747,16 +915,15 @@ class RecordingPopupManager:
     def hide_recording_popup(self):
         """Hide the recording popup and stop audio monitoring"""
         # Prevent double cleanup
-        if self.popup is None and self.audio_monitor is None:
+        if not self.is_popup_visible() and self.audio_monitor is None:
             return
             
         if self.popup:
             try:
+                # Keep the hidden popup around for the next recording
                 self.popup.hide()
             except Exception as e:
                 print(f"Error hiding popup: {e}")
-            finally:
-                self.popup = None
 
         if self.audio_monitor:
             try:
@@ -765,9 +932,41 @@ class RecordingPopupManager:
                 print(f"Error stopping audio monitor: {e}")
             finally:
                 self.audio_monitor = None
-                
+
+        self.closed_event.set()
         print("⚫ Recording stopped")
 
+    def is_popup_visible(self) -> bool:
+        """Check if the managed popup is currently showing"""
+        return self.popup is not None and self.popup.is_showing()
+
+    def wait_until_closed(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the popup is hidden
+
+        Called on the GUI thread with no event loop running (the standalone
+        test scripts), this pumps Qt events while waiting so the popup paints,
+        its buttons respond and the queued audio monitoring start runs.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            bool: True if the popup closed, False on timeout
+        """
+        app = QApplication.instance()
+        if app is None or app.thread() != QThread.currentThread():
+            return self.closed_event.wait(timeout)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.closed_event.is_set():
+            remaining = 0.03 if deadline is None else deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 30)
+            self.closed_event.wait(min(0.01, remaining))
+        return True
+
 
 # Global popup manager instance
 popup_manager = RecordingPopupManager()
@@ -784,14 +983,18 @@ def hide_recording_popup():
 
 def is_recording_popup_visible() -> bool:
     """Check if recording popup is visible"""
-    return popup_manager.popup and popup_manager.popup.is_showing()
+    return popup_manager.is_popup_visible()
+
+def wait_for_recording_popup_close(timeout: Optional[float] = None) -> bool:
+    """Wait until the recording popup is hidden; False on timeout"""
+    return popup_manager.wait_until_closed(timeout)
 
 # Test code for standalone execution
 if __name__ == "__main__":
     """Test the recording popup independently"""
     import sys
     
-    app = QApplication(sys.argv)
+    app = get_qt_application()
     
     # Create and show the popup
     popup = RecordingPopup()
@@ -3,7 +3,7 @@
 
 import multiprocessing
 from multiprocessing import Queue
-import sys
+import threading
 import logging
 from typing import Optional
 
@@ -15,8 +15,8 @@ class PopupProcess:
     def __init__(self):
         self.process: Optional[multiprocessing.Process] = None
         self.command_queue: Optional[Queue] = None
-        self.response_queue: Optional[Queue] = None
         self._started = False
+        self._last_command: Optional[str] = None
 
     def start(self):
         """Start the popup process with Qt event loop."""
@@ -25,79 +25,95 @@ class PopupProcess:
             return
 
         self.command_queue = Queue()
-        self.response_queue = Queue()
 
         self.process = multiprocessing.Process(
             target=self._run_popup_process,
-            args=(self.command_queue, self.response_queue),
+            args=(self.command_queue,),
             daemon=True
         )
         self.process.start()
         self._started = True
         logger.info("Popup process started")
 
-    def _run_popup_process(self, cmd_queue: Queue, resp_queue: Queue):
+    def _run_popup_process(self, cmd_queue: Queue):
         """Run the Qt application in a separate process."""
         try:
-            from PyQt6.QtWidgets import QApplication
-            from PyQt6.QtCore import QTimer
-            from src.gui.recording_popup import RecordingPopupManager
+            from PyQt6.QtCore import QObject, pyqtSignal
+            from src.gui.recording_popup import RecordingPopupManager, get_qt_application
 
-            app = QApplication(sys.argv)
+            app = get_qt_application()
             manager = RecordingPopupManager()
 
-            def check_commands():
-                """Check for commands from main process."""
-                try:
-                    while not cmd_queue.empty():
-                        cmd = cmd_queue.get_nowait()
+            class CommandBridge(QObject):
+                """Delivers commands from the reader thread to the Qt thread."""
+                command_received = pyqtSignal(str)
 
-                        if cmd == "show":
-                            manager.show_recording_popup()
-                            resp_queue.put("shown")
+            def apply_command(cmd):
+                """Apply a command on the Qt thread."""
+                try:
+                    if cmd == "show":
+                        manager.show_recording_popup()
 
-                        elif cmd == "hide":
-                            manager.hide_recording_popup()
-                            resp_queue.put("hidden")
+                    elif cmd == "hide":
+                        manager.hide_recording_popup()
 
-                        elif cmd == "quit":
-                            app.quit()
-                            return
+                    elif cmd == "quit":
+                        app.quit()
 
                 except Exception as e:
                     logger.error(f"Error processing command: {e}")
 
-                # Schedule next check
-                QTimer.singleShot(50, check_commands)  # Check every 50ms
+            bridge = CommandBridge()
+            bridge.command_received.connect(apply_command)
+
+            def read_commands():
+                """Block on the command queue so the process stays idle between commands."""
+                while True:
+                    commands = [cmd_queue.get()]
+                    while not cmd_queue.empty():
+                        commands.append(cmd_queue.get_nowait())
 
-            # Start checking for commands
-            check_commands()
+                    if "quit" in commands:
+                        bridge.command_received.emit("quit")
+                        return
+
+                    # Coalesce queued show/hide commands so only the final
+                    # visibility state is applied
+                    visibility = [cmd for cmd in commands if cmd in ("show", "hide")]
+                    if visibility:
+                        bridge.command_received.emit(visibility[-1])
+
+            threading.Thread(target=read_commands, name="PopupCommandReader", daemon=True).start()
 
             # Run Qt event loop
             app.exec()
 
         except Exception as e:
             logger.error(f"Error in popup process: {e}")
-            resp_queue.put(f"error: {e}")
 
-    def show(self):
-        """Show the recording popup."""
+    def set_visible(self, visible: bool):
+        """Show or hide the recording popup with a single command."""
+        command = "show" if visible else "hide"
+
         if not self._started:
+            if not visible:
+                logger.warning("Cannot hide popup - process not started")
+                return
             self.start()
 
-        if self.command_queue:
-            self.command_queue.put("show")
-            logger.debug("Sent show command to popup process")
+        # Skip the IPC round-trip when the popup is already in that state
+        if self.command_queue and self._last_command != command:
+            self.command_queue.put(command)
+            self._last_command = command
+            logger.debug(f"Sent {command} command to popup process")
+
+    def show(self):
+        """Show the recording popup."""
+        self.set_visible(True)
 
     def hide(self):
         """Hide the recording popup."""
-        if not self._started:
-            logger.warning("Cannot hide popup - process not started")
-            return
-
-        if self.command_queue:
-            self.command_queue.put("hide")
-            logger.debug("Sent hide command to popup process")
+        self.set_visible(False)
 
     def stop(self):
         """Stop the popup process."""
@@ -114,6 +130,7 @@ class PopupProcess:
                 self.process.join(timeout=1)
 
         self._started = False
+        self._last_command = None
         logger.info("Popup process stopped")
 
 
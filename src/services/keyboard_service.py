@@ -8,7 +8,10 @@ Listens for double Right Command press to trigger transcription.
 # CRITICAL: Patch faster-whisper BEFORE any RealtimeSTT imports
 # ============================================================================
 # This monkey-patches sys.modules to intercept faster_whisper imports
-# and redirect them to whisper.cpp for Metal GPU acceleration
+# and redirect them to whisper.cpp for Metal GPU acceleration.
+# Must stay at import time: RealtimeSTT's spawned transcription worker
+# re-imports this module without running main(), and only gets the patch
+# (instead of the real faster_whisper) if importing applies it.
 # ============================================================================
 from ..backends.whispercpp_fasterwhisper_compat import patch_realtimestt
 patch_realtimestt()
@@ -23,10 +26,12 @@ import traceback
 import sys
 import os
 import atexit
-from pynput import keyboard
+import logging
 from ..utils.process import SingleInstanceLock, create_daemon_thread
 from ..utils.recording_events import RecordingEvent
 
+logger = logging.getLogger(__name__)
+
 class RealtimeSTTCommunicator:
     """RealtimeSTT backend for keyboard-triggered transcription"""
 
@@ -68,6 +73,16 @@ class RealtimeSTTCommunicator:
         self.recording_thread = None
         self.stop_requested = False
 
+        # Resolve popup hooks once; fall back to no-ops when the GUI is unavailable
+        try:
+            from ..gui.recording_popup_process import show_recording_popup, hide_recording_popup
+            self._show_popup = show_recording_popup
+            self._hide_popup = hide_recording_popup
+        except Exception as e:
+            print(f"Warning: Recording popup unavailable: {e}")
+            self._show_popup = lambda: None
+            self._hide_popup = lambda: None
+
     def start_recording(self):
         """Start recording in background thread with popup"""
         if self.is_transcribing:
@@ -81,8 +96,7 @@ class RealtimeSTTCommunicator:
 
         # Show recording popup
         try:
-            from ..gui.recording_popup_process import show_recording_popup
-            show_recording_popup()
+            self._show_popup()
         except Exception as e:
             print(f"Warning: Could not show recording popup: {e}")
 
@@ -116,8 +130,7 @@ class RealtimeSTTCommunicator:
 
                 # Hide popup when recording ends
                 try:
-                    from ..gui.recording_popup_process import hide_recording_popup
-                    hide_recording_popup()
+                    self._hide_popup()
                 except Exception as e:
                     print(f"Warning: Could not hide recording popup: {e}")
 
@@ -161,8 +174,7 @@ class RealtimeSTTCommunicator:
 
             # Hide popup when recording stops
             try:
-                from ..gui.recording_popup_process import hide_recording_popup
-                hide_recording_popup()
+                self._hide_popup()
             except Exception as e:
                 print(f"Warning: Could not hide recording popup: {e}")
 
@@ -181,21 +193,20 @@ class DoubleCommandKeyListener:
     def __init__(self, docker_communicator, event_manager=None):
         self.communicator = docker_communicator
         self.event_manager = event_manager
+        from pynput import keyboard
         self.key = keyboard.Key.cmd_r
         self.last_press_time = 0  # Initialize to 0
 
     def on_key_press(self, key):
         try:
-            # Debug: Log all right command key presses
-            if key == self.key:
-                print(f"🔍 DEBUG: Right Command key pressed at {time.time()}")
-
             if key == self.key:
                 current_time = time.time()
                 # Calculate time difference from last press
                 time_diff = current_time - self.last_press_time if self.last_press_time > 0 else 999
 
-                print(f"🔍 DEBUG: Time since last press: {time_diff:.3f}s, is_transcribing: {self.communicator.is_transcribing}")
+                # Debug output stays off the key hook path unless DEBUG logging is enabled
+                logger.debug("Right Command pressed at %s (%.3fs since last press, is_transcribing: %s)",
+                             current_time, time_diff, self.communicator.is_transcribing)
 
                 # Priority 1: Check for double-click to start recording
                 if 0 < time_diff < 2.0 and not self.communicator.is_transcribing:
@@ -241,7 +252,9 @@ def main():
             # Warm up Ollama at startup for instant enhancement
             from ..services.text_enhancement_service import get_text_enhancement_service
             text_enhancer = get_text_enhancement_service()
-            print("✅ Ollama ready for text enhancement")
+            # Starts the background warmup now; the first enhance call reuses the service
+            text_enhancer.start_warmup()
+            print("✅ Ollama warmup started for text enhancement")
 
             print("\n🎤 Starting key listener for double Command press...")
             print("Double-press Right Command to start recording")
@@ -316,16 +329,25 @@ def main():
 
 
             # Start the keyboard listener
+            from pynput import keyboard
             listener = keyboard.Listener(
                 on_press=key_listener.on_key_press,
                 on_release=key_listener.on_key_release
             )
             listener.start()
+            # Block until the input hook is installed, so the service is really
+            # listening once startup finishes and no early key press is lost
+            listener.wait()
 
             # Store listener reference for device change cleanup
             device_manager._keyboard_listener = listener
 
-            listener.join()  # Keep the script running
+            try:
+                # join() sleeps in the OS until the listener exits; no polling
+                listener.join()  # Keep the script running
+            finally:
+                # Unhook input on Ctrl+C or errors instead of leaving the tap behind
+                listener.stop()
         finally:
             # Release the lock when exiting
             lock.release()
@@ -20,6 +20,21 @@ from ..config import CONFIG
 class TextEnhancementService:
     """Enhances transcribed text with smart capitalization and punctuation."""
 
+    # Word lists are shared by all instances instead of rebuilt per instance/call
+
+    # Words that should always be lowercase (unless at start)
+    lowercase_words = frozenset({'a', 'an', 'the', 'and', 'but', 'or', 'for', 'nor',
+                                 'on', 'at', 'to', 'from', 'by', 'in', 'of', 'with'})
+
+    # Common sentence starters that should be capitalized
+    sentence_starters = frozenset({'i', 'you', 'he', 'she', 'it', 'we', 'they',
+                                   'what', 'when', 'where', 'why', 'how', 'who',
+                                   'open', 'close', 'start', 'stop', 'create', 'delete'})
+
+    # Known proper nouns for short-text capitalization
+    common_proper_nouns = frozenset({'amazon', 'google', 'apple', 'microsoft', 'claude',
+                                     'jarvis', 'siri', 'alexa', 'python', 'java'})
+
     def __init__(self, config: Optional[dict] = None):
         """
         Initialize text enhancement service.
@@ -38,16 +53,21 @@ class TextEnhancementService:
         # Thresholds for different processing strategies
         self.min_words_for_enhancement = self.config.get('min_words_for_enhancement', 3)
 
-        # Words that should always be lowercase (unless at start)
-        self.lowercase_words = {'a', 'an', 'the', 'and', 'but', 'or', 'for', 'nor',
-                                'on', 'at', 'to', 'from', 'by', 'in', 'of', 'with'}
+        # No warmup here - OllamaService handles its own warmup
 
-        # Common sentence starters that should be capitalized
-        self.sentence_starters = {'i', 'you', 'he', 'she', 'it', 'we', 'they',
-                                   'what', 'when', 'where', 'why', 'how', 'who',
-                                   'open', 'close', 'start', 'stop', 'create', 'delete'}
+    def _get_ollama(self):
+        """Get the shared Ollama service for this configuration (created with warmup)"""
+        from ..utils.ollama_service import get_ollama_service
+        return get_ollama_service(
+            model=self.ollama_model,
+            url=self.ollama_url,
+            default_timeout_ms=self.max_latency_ms
+        )
 
-        # No warmup here - OllamaService handles its own warmup
+    def start_warmup(self):
+        """Create the Ollama service now so its warmup runs before the first dictation"""
+        if self.engine == 'ollama':
+            self._get_ollama()
 
     def enhance(self, text: str) -> str:
         """
@@ -63,11 +83,11 @@ class TextEnhancementService:
             return text
 
         text = text.strip()
-        word_count = len(text.split())
+        words = text.split()
 
-        # Very short text - minimal processing
-        if word_count < self.min_words_for_enhancement:
-            return self._process_short_text(text)
+        # Very short text - minimal processing (reuses the split words)
+        if len(words) < self.min_words_for_enhancement:
+            return self._process_short_text(text, words)
 
         # Route to appropriate engine
         if self.engine == 'ollama':
@@ -87,14 +107,8 @@ class TextEnhancementService:
         Returns:
             Enhanced text with proper punctuation/capitalization
         """
-        from ..utils.ollama_service import get_ollama_service
-        
         # Get singleton Ollama service (with warmup)
-        ollama = get_ollama_service(
-            model=self.ollama_model,
-            url=self.ollama_url,
-            default_timeout_ms=self.max_latency_ms
-        )
+        ollama = self._get_ollama()
         
         enhanced = ollama.enhance_text(text, timeout_ms=self.max_latency_ms)
         
@@ -104,7 +118,7 @@ class TextEnhancementService:
         # Fallback to rules if Ollama fails (silent fallback)
         return self._process_with_rules(text)
 
-    def _process_short_text(self, text: str) -> str:
+    def _process_short_text(self, text: str, words: Optional[list] = None) -> str:
         """
         Process very short text (1-2 words).
 
@@ -114,16 +128,19 @@ class TextEnhancementService:
 
         Args:
             text: Short text
+            words: Already-split words of text, if the caller has them
 
         Returns:
             Processed text
         """
-        words = text.split()
+        if words is None:
+            words = text.split()
 
         if len(words) == 1:
             # Single word - keep lowercase unless it's a proper noun or sentence starter
             word = words[0].lower()
-            if word in self.sentence_starters or self._is_proper_noun(word):
+            # word is already lowercase: check the proper-noun set directly
+            if word in self.sentence_starters or word in self.common_proper_nouns:
                 return word.capitalize()
             return word
 
@@ -182,8 +199,9 @@ class TextEnhancementService:
                     processed_words.append(word)
 
                 # Common lowercase words - keep lowercase
-                elif word.lower() in self.lowercase_words:
-                    processed_words.append(word.lower())
+                # (no capitals reach here, so lower() is a no-op: skip the copies)
+                elif word in self.lowercase_words:
+                    processed_words.append(word)
 
                 # Default - keep as is
                 else:
@@ -210,9 +228,7 @@ class TextEnhancementService:
             True if likely a proper noun
         """
         # Very simple heuristic - expand as needed
-        common_proper_nouns = {'amazon', 'google', 'apple', 'microsoft', 'claude',
-                                'jarvis', 'siri', 'alexa', 'python', 'java'}
-        return word.lower() in common_proper_nouns
+        return word.lower() in self.common_proper_nouns
 
 
 # Singleton instance for convenience
@@ -13,6 +13,22 @@ import re
 import shlex
 
 
+# Characters outside the AppleScript whitelist (alphanumeric, whitespace, quotes,
+# brackets and basic punctuation); compiled once instead of per character
+_DISALLOWED_APPLESCRIPT_CHARS = re.compile(r'[^a-zA-Z0-9\s\"\'\(\)\{\}\[\]\.\,\:\;\-\_\&\|\n\t]')
+
+_DANGEROUS_APPLESCRIPT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'do\s+shell\s+script',  # Execute shell commands
+        r'system\s+events.*keystroke.*["\'][^"\']*[;\|&][^"\']*["\']',  # Command injection in keystroke
+        r'tell\s+application\s+["\']terminal["\']',  # Terminal access
+        r'activate\s+application\s+["\'][^"\']*[;\|&]',  # Application activation with injection
+    )
+]
+
+# Set once permissions are confirmed; macOS grants persist for the process lifetime
+_permissions_granted = False
+
 def is_macos():
     """Check if running on macOS"""
     return platform.system() == 'Darwin'
@@ -28,20 +44,12 @@ def _sanitize_applescript(script):
     
     # Remove any suspicious characters that could be used for injection
     # Allow only alphanumeric, spaces, quotes, parentheses, and AppleScript keywords
-    allowed_pattern = r'[a-zA-Z0-9\s\"\'\(\)\{\}\[\]\.\,\:\;\-\_\&\|\n\t]'
-    sanitized = ''.join(char for char in script if re.match(allowed_pattern, char))
+    sanitized = _DISALLOWED_APPLESCRIPT_CHARS.sub('', script)
     
     # Check for dangerous patterns
-    dangerous_patterns = [
-        r'do\s+shell\s+script',  # Execute shell commands
-        r'system\s+events.*keystroke.*["\'][^"\']*[;\|&][^"\']*["\']',  # Command injection in keystroke
-        r'tell\s+application\s+["\']terminal["\']',  # Terminal access
-        r'activate\s+application\s+["\'][^"\']*[;\|&]',  # Application activation with injection
-    ]
-    
-    for pattern in dangerous_patterns:
-        if re.search(pattern, sanitized, re.IGNORECASE):
-            raise ValueError(f"Potentially dangerous AppleScript pattern detected: {pattern}")
+    for pattern in _DANGEROUS_APPLESCRIPT_PATTERNS:
+        if pattern.search(sanitized):
+            raise ValueError(f"Potentially dangerous AppleScript pattern detected: {pattern.pattern}")
     
     return sanitized
 
@@ -76,6 +84,66 @@ def _execute_applescript_safely(script, timeout=5):
         raise RuntimeError(f"AppleScript execution failed: {e}")
 
 
+def _current_layout_keycode(char):
+    """
+    Find the virtual key code that types char on the current keyboard layout
+
+    Cmd shortcuts follow the layout (Cmd+V on Dvorak is the physical "." key),
+    so a fixed ANSI key code pastes only on QWERTY. Resolved on every call
+    because the user can switch layouts while the service runs.
+
+    Args:
+        char: Single character to look up
+
+    Returns:
+        int key code, or None if the layout can't be read
+    """
+    try:
+        # pynput already wraps TISCopyCurrentKeyboardInputSource + UCKeyTranslate
+        from pynput._util.darwin import get_unicode_to_keycode_map
+        return get_unicode_to_keycode_map().get(char)
+    except Exception:
+        return None
+
+
+def send_paste_keystroke():
+    """
+    Post Cmd+V to the frontmost application through Quartz CGEvents.
+
+    Pasting this way is an in-process call, where every osascript paste forks
+    a process and starts the AppleScript interpreter. Needs the same
+    Accessibility permission as the System Events keystroke.
+
+    Returns:
+        bool: True if the keystroke was posted, False if Quartz (pyobjc) is
+              unavailable, Accessibility permission isn't granted or the
+              layout has no V key (callers then use the osascript paste)
+    """
+    if not is_macos():
+        return False
+
+    # Without the permission CGEventPost drops the events silently, so report
+    # failure and let callers fall back (the check is cached once granted)
+    if not check_accessibility_permissions():
+        return False
+
+    try:
+        import Quartz
+    except ImportError:
+        return False
+
+    keycode = _current_layout_keycode('v')
+    if keycode is None:
+        return False
+
+    # Key down then key up, both carrying the Command modifier
+    for key_down in (True, False):
+        event = Quartz.CGEventCreateKeyboardEvent(None, keycode, key_down)
+        Quartz.CGEventSetFlags(event, Quartz.kCGEventFlagMaskCommand)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+    return True
+
+
 def check_accessibility_permissions():
     """
     Check if the current application has accessibility permissions on macOS.
@@ -83,9 +151,15 @@ def check_accessibility_permissions():
     Returns:
         bool: True if permissions are granted or not on macOS, False if denied on macOS
     """
+    global _permissions_granted
+
     if not is_macos():
         # On non-macOS systems, assume permissions are available
         return True
+
+    # Skip the osascript round-trip once permissions have been confirmed
+    if _permissions_granted:
+        return True
     
     try:
         # Use AppleScript to check if we can control other applications
@@ -102,7 +176,8 @@ def check_accessibility_permissions():
         '''
         
         result = _execute_applescript_safely(applescript, timeout=5)
-        return result.stdout.strip() == "success"
+        _permissions_granted = result.stdout.strip() == "success"
+        return _permissions_granted
         
     except (RuntimeError, ValueError) as e:
         print(f"AppleScript execution error: {e}")
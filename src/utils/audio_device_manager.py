@@ -27,6 +27,7 @@ Requirements:
 
 import threading
 import time
+import random
 import logging
 import subprocess
 from typing import Optional, Callable, List
@@ -48,6 +49,9 @@ class AudioDeviceManager:
     _instance: Optional['AudioDeviceManager'] = None
     _lock = threading.Lock()
 
+    # Upper bound for the poll interval while SwitchAudioSource keeps failing
+    MAX_POLL_BACKOFF = 30.0
+
     def __init__(self):
         """Initialize AudioDeviceManager. Use get_instance() instead."""
         self._current_device_name: Optional[str] = None
@@ -234,6 +238,10 @@ class AudioDeviceManager:
         """
         logger.debug(f"Device monitoring loop started (polling every {poll_interval}s)")
 
+        # Failed queries back off exponentially (with jitter) up to
+        # MAX_POLL_BACKOFF; the first successful query restores poll_interval
+        delay = poll_interval
+
         while not self._stop_event.is_set():
             try:
                 # Read previous device name BEFORE querying
@@ -255,15 +263,33 @@ class AudioDeviceManager:
                         except Exception as e:
                             logger.error(f"Error in device change callback: {e}")
 
-                # Sleep until next poll
-                self._stop_event.wait(timeout=poll_interval)
+                if device_name is None:
+                    delay = self._next_backoff(delay)
+                else:
+                    delay = poll_interval
 
             except Exception as e:
                 logger.error(f"Error in device monitoring loop: {e}")
-                self._stop_event.wait(timeout=poll_interval)
+                delay = self._next_backoff(delay)
+
+            # Sleep until next poll
+            self._stop_event.wait(timeout=delay)
 
         logger.debug("Device monitoring loop exited")
 
+    def _next_backoff(self, delay: float) -> float:
+        """
+        Compute the poll delay after a failed device query.
+
+        Args:
+            delay: Delay used before the failed query
+
+        Returns:
+            float: Doubled delay capped at MAX_POLL_BACKOFF, plus up to 10% jitter
+        """
+        delay = min(delay * 2, self.MAX_POLL_BACKOFF)
+        return delay + random.uniform(0, delay * 0.1)
+
     def cleanup(self) -> None:
         """
         Cleanup resources and stop monitoring.
@@ -3,9 +3,11 @@ Real-time Audio Level Monitor for Recording Popup
 Captures microphone input and calculates audio levels for waveform visualization
 """
 
+import atexit
 import threading
 import time
 import numpy as np
+from collections import deque
 from typing import Optional, Callable
 try:
     import pyaudio
@@ -14,6 +16,30 @@ except ImportError:
     PYAUDIO_AVAILABLE = False
     print("⚠️ PyAudio not available - audio level monitoring disabled")
 
+# One PortAudio instance for the whole process; initializing PortAudio
+# enumerates every device, so monitors only open/close streams on it
+_pyaudio_instance = None
+
+
+def _get_pyaudio():
+    """Get or create the shared PyAudio instance"""
+    global _pyaudio_instance
+    if _pyaudio_instance is None:
+        _pyaudio_instance = pyaudio.PyAudio()
+        atexit.register(_terminate_pyaudio)
+    return _pyaudio_instance
+
+
+def _terminate_pyaudio():
+    """Release PortAudio at interpreter exit"""
+    global _pyaudio_instance
+    if _pyaudio_instance is not None:
+        try:
+            _pyaudio_instance.terminate()
+        except OSError:
+            pass
+        _pyaudio_instance = None
+
 
 class AudioLevelMonitor:
     """
@@ -33,8 +59,9 @@ class AudioLevelMonitor:
         self.monitor_thread: Optional[threading.Thread] = None
         
         # PyAudio configuration
-        self.chunk = 1024  # Number of frames per buffer
         self.sample_rate = 44100  # Sample rate
+        # One read per level update: 20 ms of audio gives ~50 updates per second
+        self.chunk = self.sample_rate // 50  # Number of frames per buffer
         self.channels = 1  # Mono
         self.format = pyaudio.paInt16 if PYAUDIO_AVAILABLE else None
         
@@ -42,8 +69,10 @@ class AudioLevelMonitor:
         self.stream = None
         
         # Level calculation
-        self.rms_window = []
         self.window_size = 5  # Average over 5 samples for smoother levels
+        self.rms_window = deque(maxlen=self.window_size)
+        # Reused float32 scratch for the int16 samples of one read
+        self._samples = np.empty(self.chunk, dtype=np.float32)
     
     def start_monitoring(self):
         """Start monitoring audio levels"""
@@ -56,7 +85,7 @@ class AudioLevelMonitor:
             
         try:
             self.is_monitoring = True
-            self.audio = pyaudio.PyAudio()
+            self.audio = _get_pyaudio()
             
             # Open microphone stream
             self.stream = self.audio.open(
@@ -88,16 +117,14 @@ class AudioLevelMonitor:
             try:
                 self.stream.stop_stream()
                 self.stream.close()
-            except:
-                pass
-            self.stream = None
+            except OSError as e:
+                # PyAudio reports stream teardown failures as OSError
+                print(f"⚠️ Error closing audio stream: {e}")
+            finally:
+                self.stream = None
             
-        if self.audio:
-            try:
-                self.audio.terminate()
-            except:
-                pass
-            self.audio = None
+        # The shared PyAudio instance stays alive for the next recording
+        self.audio = None
             
         # Wait for monitor thread to finish
         if self.monitor_thread and self.monitor_thread.is_alive():
@@ -112,31 +139,29 @@ class AudioLevelMonitor:
                 # Read audio data
                 data = self.stream.read(self.chunk, exception_on_overflow=False)
                 
-                # Convert to numpy array
-                audio_data = np.frombuffer(data, dtype=np.int16)
+                # Convert into the preallocated float32 scratch (no per-read arrays)
+                samples = self._samples[:len(data) // 2]
+                samples[:] = np.frombuffer(data, dtype=np.int16)
                 
                 # Calculate RMS (Root Mean Square) for audio level
-                rms = np.sqrt(np.mean(audio_data.astype(np.float64) ** 2))
+                # np.dot squares and sums in one pass without a temporary
+                rms = np.sqrt(np.dot(samples, samples) / len(samples)) if len(samples) else 0.0
                 
                 # Normalize to 0.0 - 1.0 range
                 # 32767 is max value for int16
                 normalized_level = min(1.0, rms / 8000.0)  # Adjust divisor for sensitivity
                 
-                # Apply smoothing window
+                # Apply smoothing window (deque drops the oldest level)
                 self.rms_window.append(normalized_level)
-                if len(self.rms_window) > self.window_size:
-                    self.rms_window.pop(0)
                 
                 # Calculate smoothed average
                 smoothed_level = sum(self.rms_window) / len(self.rms_window)
                 
                 # Call callback with level
+                # (the blocking read above paces the loop; no sleep needed)
                 if self.callback:
                     self.callback(smoothed_level)
                 
-                # Small delay to prevent overwhelming the callback
-                time.sleep(0.02)  # ~50 updates per second
-                
             except Exception as e:
                 if self.is_monitoring:  # Only log if we're still supposed to be monitoring
                     print(f"Audio monitoring error: {e}")
@@ -149,7 +174,7 @@ class AudioLevelMonitor:
             
         devices = []
         try:
-            audio = pyaudio.PyAudio()
+            audio = _get_pyaudio()
             
             for i in range(audio.get_device_count()):
                 info = audio.get_device_info_by_index(i)
@@ -160,8 +185,6 @@ class AudioLevelMonitor:
                         'channels': info['maxInputChannels'],
                         'sample_rate': int(info['defaultSampleRate'])
                     })
-            
-            audio.terminate()
         except Exception as e:
             print(f"Error getting audio devices: {e}")
             
@@ -173,7 +196,9 @@ class MockAudioMonitor:
     Mock audio monitor for testing when PyAudio is not available
     Generates fake audio levels for development
     """
-    
+
+    FRAME_RATE = 30  # Fake level updates per second, matching the popup's ~33 FPS animation
+
     def __init__(self, callback: Optional[Callable[[float], None]] = None):
         self.callback = callback
         self.is_monitoring = False
@@ -202,25 +227,44 @@ class MockAudioMonitor:
     
     def _mock_loop(self):
         """Generate fake audio levels for testing"""
-        import random
-        import math
+        # Levels are generated a second at a time with NumPy into reused
+        # buffers, then handed out one per frame
+        rng = np.random.default_rng()
+        block = np.arange(self.FRAME_RATE, dtype=np.float64)
+        levels = np.empty(self.FRAME_RATE)
+        spikes = np.empty(self.FRAME_RATE)
         
+        # Pace frames against a monotonic deadline so time spent in the
+        # callback doesn't stretch the interval, and skip ahead if we fall behind
+        frame_interval = 1.0 / self.FRAME_RATE
+        next_frame = time.monotonic()
         frame = 0
         while self.is_monitoring:
-            # Generate realistic-looking audio levels
-            # Base level with some variation
-            base_level = 0.1 + 0.3 * abs(math.sin(frame * 0.1))
-            # Add random spikes to simulate speech
-            if random.random() < 0.3:  # 30% chance of speech spike
-                base_level += random.uniform(0.2, 0.6)
-            
-            level = min(1.0, base_level)
+            index = frame % self.FRAME_RATE
+            if index == 0:
+                # Generate realistic-looking audio levels
+                # Base level with some variation
+                np.multiply(block + frame, 0.1, out=levels)
+                np.sin(levels, out=levels)
+                np.abs(levels, out=levels)
+                levels *= 0.3
+                levels += 0.1
+                # Add random spikes to simulate speech: a draw below 0.3
+                # (30% chance) is rescaled onto a 0.2-0.6 spike
+                rng.random(out=spikes)
+                np.add(levels, 0.2 + spikes * (0.4 / 0.3), out=levels, where=spikes < 0.3)
+                np.minimum(levels, 1.0, out=levels)
             
             if self.callback:
-                self.callback(level)
+                self.callback(float(levels[index]))
             
             frame += 1
-            time.sleep(0.05)  # 20 FPS
+            next_frame += frame_interval
+            delay = next_frame - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_frame = time.monotonic()
     
     def get_available_devices(self):
         """Return mock device list"""
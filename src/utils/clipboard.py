@@ -4,11 +4,197 @@ Unified Clipboard Manager for Whisper Dictation
 Consolidates all clipboard handling with robust error handling and multiple fallback methods
 """
 
-import subprocess
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from .accessibility import _execute_applescript_safely
+from .accessibility import send_paste_keystroke, _execute_applescript_safely
+
+# The macOS general pasteboard via AppKit (pyobjc); None until first use,
+# False when AppKit is unavailable
+_pasteboard = None
+
+
+def _get_pasteboard():
+    """Get the shared NSPasteboard, or None when AppKit isn't available"""
+    global _pasteboard
+    if _pasteboard is None:
+        try:
+            from AppKit import NSPasteboard
+            _pasteboard = NSPasteboard.generalPasteboard()
+        except ImportError:
+            _pasteboard = False
+    return _pasteboard or None
+
+
+def read_clipboard() -> Optional[str]:
+    """
+    Read the clipboard's text
+    
+    Uses NSPasteboard in-process on macOS; pyperclip (a pbpaste/xclip
+    subprocess) elsewhere.
+    
+    Returns:
+        Optional[str]: Clipboard text, or None when it holds no text
+    """
+    pasteboard = _get_pasteboard()
+    if pasteboard is not None:
+        from AppKit import NSPasteboardTypeString
+        return pasteboard.stringForType_(NSPasteboardTypeString)
+
+    import pyperclip
+    return pyperclip.paste()
+
+
+def write_clipboard(text: str) -> bool:
+    """
+    Replace the clipboard contents with text (unverified)
+    
+    Args:
+        text: Text to place on the clipboard
+        
+    Returns:
+        bool: True if the write was accepted
+    """
+    pasteboard = _get_pasteboard()
+    if pasteboard is not None:
+        from AppKit import NSPasteboardTypeString
+        pasteboard.clearContents()
+        return bool(pasteboard.setString_forType_(text, NSPasteboardTypeString))
+
+    import pyperclip
+    pyperclip.copy(text)
+    return True
+
+
+def snapshot_clipboard():
+    """
+    Capture the whole clipboard so it can be put back after a paste
+    
+    On macOS every pasteboard item is kept with the raw data of each of its
+    types, so images, rich text and file references survive the round trip,
+    not just plain text. Elsewhere only text is available (pyperclip).
+    
+    Returns:
+        Snapshot for restore_clipboard_snapshot(), or None when the clipboard is empty
+    """
+    pasteboard = _get_pasteboard()
+    if pasteboard is not None:
+        items = []
+        for item in pasteboard.pasteboardItems() or ():
+            representations = []
+            for data_type in item.types():
+                data = item.dataForType_(data_type)
+                if data is not None:
+                    representations.append((data_type, data))
+            if representations:
+                items.append(representations)
+        return items or None
+
+    import pyperclip
+    return pyperclip.paste() or None
+
+
+def restore_clipboard_snapshot(snapshot) -> bool:
+    """
+    Put a snapshot from snapshot_clipboard() back on the clipboard
+    
+    Args:
+        snapshot: Value returned by snapshot_clipboard()
+        
+    Returns:
+        bool: True if the clipboard was rewritten
+    """
+    if snapshot is None:
+        return False
+
+    pasteboard = _get_pasteboard()
+    if pasteboard is not None:
+        from AppKit import NSPasteboardItem
+        items = []
+        for representations in snapshot:
+            item = NSPasteboardItem.alloc().init()
+            for data_type, data in representations:
+                item.setData_forType_(data, data_type)
+            items.append(item)
+        pasteboard.clearContents()
+        return bool(pasteboard.writeObjects_(items))
+
+    import pyperclip
+    pyperclip.copy(snapshot)
+    return True
+
+
+def wait_for_clipboard(text: str, timeout: float = 0.5) -> bool:
+    """
+    Poll until the clipboard holds text, instead of sleeping a fixed settle time
+    
+    Args:
+        text: Text expected on the clipboard
+        timeout: Seconds to keep polling
+        
+    Returns:
+        bool: True as soon as the clipboard holds text, False on timeout
+    """
+    deadline = time.monotonic() + timeout
+    pasteboard = _get_pasteboard()
+    if pasteboard is not None:
+        # changeCount is a cheap in-process read: poll it tightly and only
+        # re-read the string when the pasteboard has actually changed
+        change_count = pasteboard.changeCount()
+        while read_clipboard() != text:
+            while pasteboard.changeCount() == change_count:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.001)
+            change_count = pasteboard.changeCount()
+        return True
+
+    # pyperclip reads spawn a pbpaste/xclip process each, so back off
+    interval = 0.02
+    while read_clipboard() != text:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, 0.2)
+    return True
+
+
+def copy_text_verified(text: str) -> bool:
+    """
+    Put text on the clipboard and confirm it landed
+
+    With AppKit the write is an in-process pasteboard call: the change count
+    tells whether anything else touched the pasteboard since our write, so no
+    settle delay or pbpaste read-back is needed. Without AppKit this falls
+    back to pyperclip with read-back retries.
+
+    Args:
+        text: Text to place on the clipboard
+
+    Returns:
+        bool: True if the clipboard now holds text
+    """
+    pasteboard = _get_pasteboard()
+    if pasteboard is not None:
+        from AppKit import NSPasteboardTypeString
+        for retry in range(3):
+            change_count = pasteboard.clearContents()
+            if (pasteboard.setString_forType_(text, NSPasteboardTypeString)
+                    and pasteboard.changeCount() == change_count
+                    and pasteboard.stringForType_(NSPasteboardTypeString) == text):
+                return True
+        return False
+
+    import pyperclip
+    for retry in range(3):
+        pyperclip.copy(text)
+        
+        # Verify clipboard contents as soon as they update
+        if wait_for_clipboard(text, timeout=0.2):
+            return True
+    return False
 
 
 class ClipboardManager:
@@ -19,24 +205,23 @@ class ClipboardManager:
     - Clipboard preservation and restoration
     - Multi-tier paste fallback system
     - Text sanitization and validation
-    - macOS-optimized with pbcopy/pbpaste integration
+    - macOS-optimized with in-process NSPasteboard access
     - AppleScript and keyboard simulation fallbacks
     """
     
     def __init__(self):
-        self.preserved_content: Optional[str] = None
+        self.preserved_content = None  # snapshot_clipboard() result
     
     def preserve_clipboard(self) -> bool:
         """
-        Preserve current clipboard content using pbpaste (macOS optimized)
+        Preserve current clipboard content, every pasteboard type on macOS
+        (images and rich text too), without a pbpaste process
         
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            result = subprocess.run(['pbpaste'], capture_output=True, text=True, check=True)
-            self.preserved_content = result.stdout
-
+            self.preserved_content = snapshot_clipboard()
             return True
         except Exception as e:
             print(f"Warning: Could not preserve clipboard: {e}")
@@ -52,13 +237,7 @@ class ClipboardManager:
         """
         if self.preserved_content is not None:
             try:
-                process = subprocess.Popen(
-                    ['pbcopy'],
-                    stdin=subprocess.PIPE,
-                    close_fds=True
-                )
-                process.communicate(input=self.preserved_content.encode('utf-8'))
-                return True
+                return restore_clipboard_snapshot(self.preserved_content)
             except Exception as e:
                 print(f"Warning: Could not restore clipboard: {e}")
                 return False
@@ -88,14 +267,8 @@ class ClipboardManager:
             return False
         
         try:
-            # Use pbcopy - simple and direct, no retries needed
-            process = subprocess.Popen(
-                ['pbcopy'],
-                stdin=subprocess.PIPE,
-                close_fds=True
-            )
-            process.communicate(input=text.encode('utf-8'))
-            return True
+            # In-process pasteboard write - simple and direct, no retries needed
+            return write_clipboard(text)
             
         except Exception as e:
             print(f"Error copying to clipboard: {e}")
@@ -167,7 +340,11 @@ class ClipboardManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        # Try AppleScript first (most reliable)
+        # In-process Cmd+V first: no osascript process per paste
+        if send_paste_keystroke():
+            return True
+        
+        # Then AppleScript (most reliable)
         if self.paste_from_clipboard_applescript():
             return True
         
@@ -196,7 +373,9 @@ class ClipboardManager:
             if not self.copy_to_clipboard(text):
                 return False
             
-            time.sleep(0.5)  # Allow clipboard to settle
+            # Allow clipboard to settle: returns as soon as it reads back
+            # (immediately with NSPasteboard) rather than after a fixed 0.5s
+            wait_for_clipboard(text.strip())
             
             # Paste from clipboard
             if self.paste_from_clipboard():
@@ -228,6 +407,8 @@ class TranscriptionHandler:
         # Initialize text enhancement service
         from ..services.text_enhancement_service import get_text_enhancement_service
         self.text_enhancer = get_text_enhancement_service()
+        # Runs enhancement (an Ollama round trip) alongside the raw clipboard copy
+        self._enhance_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="text-enhance")
     
     def handle_transcription(self, text: str, source: str) -> bool:
         """
@@ -246,12 +427,16 @@ class TranscriptionHandler:
             
         text = text.strip()
         
+        # Step 2 doesn't depend on step 1, so start enhancement
+        # (capitalization, punctuation, grammar) in the background first
+        enhanced_future = self._enhance_executor.submit(self.text_enhancer.enhance, text)
+        
         # Step 1: Copy raw text to clipboard (preserves in clipboard history)
         self.clipboard.copy_to_clipboard(text)
         time.sleep(0.1)  # Brief pause to ensure clipboard manager captures it
         
-        # Step 2: Apply text enhancement (capitalization, punctuation, grammar)
-        enhanced_text = self.text_enhancer.enhance(text)
+        # Step 2: Collect the enhanced text
+        enhanced_text = enhanced_future.result()
         
         # Step 3: Copy enhanced text and paste to active window
         return self.clipboard.copy_and_paste_text(enhanced_text)
@@ -8,22 +8,32 @@ Use Cases:
 - Other AI-powered text transformations
 """
 
+import json
+import re
 import time
+import logging
+import threading
 import requests
 from typing import Optional, Dict, Any
 
+from .process import create_daemon_thread
+
+logger = logging.getLogger(__name__)
+
 
 class OllamaService:
     """
     Generic Ollama service with warmup, error handling, and flexible configuration.
     
     Features:
-    - Model warmup at initialization (eliminates first-call latency)
+    - Background model warmup at initialization (eliminates first-call latency)
     - Configurable timeout per request
     - Automatic error handling and retries
     - Support for multiple use cases via generate()
     """
     
+    DEFAULT_TEMPERATURE = 0.1  # Low temperature for consistent corrections
+    
     def __init__(
         self,
         model: str = "llama3.2:1b",
@@ -38,15 +48,26 @@ class OllamaService:
             model: Ollama model name (default: llama3.2:1b)
             url: Ollama API endpoint
             default_timeout_ms: Default timeout in milliseconds
-            warmup: Whether to warmup model at initialization
+            warmup: Whether to warmup model at initialization (non-blocking)
         """
         self.model = model
         self.url = url
         self.default_timeout_ms = default_timeout_ms
-        self.is_ready = False
+        # Set when warmup has finished, whether or not it succeeded
+        self._warmup_done = threading.Event()
+        self._ready = False
+        # Shared (never mutated) options for the default-parameter path
+        self._default_options = {"temperature": self.DEFAULT_TEMPERATURE}
         
         if warmup:
-            self._warmup()
+            create_daemon_thread(self._warmup, name="ollama-warmup").start()
+        else:
+            self._warmup_done.set()
+    
+    @property
+    def is_ready(self) -> bool:
+        """Whether warmup has completed successfully"""
+        return self._ready
     
     def _warmup(self):
         """Preload Ollama model to ensure fast inference."""
@@ -63,18 +84,21 @@ class OllamaService:
                 timeout=30.0  # 30s warmup timeout for large models
             )
             if response.status_code == 200:
-                self.is_ready = True
+                self._ready = True
+                # User-facing status stays on stdout; nothing configures logging
+                # handlers, so an info record would never be shown
                 print(f"[OllamaService] Model {self.model} warmed up and ready")
             else:
-                print(f"[OllamaService] Warmup failed: HTTP {response.status_code}")
+                logger.warning("Warmup failed: HTTP %s", response.status_code)
         except Exception as e:
-            print(f"[OllamaService] Ollama not available: {e}")
-            print("[OllamaService] Service will operate in degraded mode")
+            logger.warning("Ollama not available: %s - service will operate in degraded mode", e)
+        finally:
+            self._warmup_done.set()
     
     def generate(
         self,
         prompt: str,
-        temperature: float = 0.1,
+        temperature: float = DEFAULT_TEMPERATURE,
         max_tokens: Optional[int] = None,
         timeout_ms: Optional[int] = None,
         options: Optional[Dict[str, Any]] = None
@@ -92,21 +116,27 @@ class OllamaService:
         Returns:
             Generated text or None on error
         """
-        if not self.is_ready:
-            print("[OllamaService] Service not ready (warmup failed)")
+        # Callers arriving during warmup wait briefly instead of failing
+        # outright; once warmup has failed they return at once
+        self._warmup_done.wait(timeout=0.5)
+        if not self._ready:
+            logger.debug("Service not ready (warmup pending or failed)")
             return None
         
         timeout_ms = timeout_ms or self.default_timeout_ms
         start_time = time.time()
         
-        # Build options
-        ollama_options = {
-            "temperature": temperature,
-        }
-        if max_tokens is not None:
-            ollama_options["num_predict"] = max_tokens
-        if options:
-            ollama_options.update(options)
+        # Build options (reuse the shared dict when nothing is overridden)
+        if options is None and max_tokens is None and temperature == self.DEFAULT_TEMPERATURE:
+            ollama_options = self._default_options
+        else:
+            ollama_options = {
+                "temperature": temperature,
+            }
+            if max_tokens is not None:
+                ollama_options["num_predict"] = max_tokens
+            if options:
+                ollama_options.update(options)
         
         try:
             response = requests.post(
@@ -121,18 +151,20 @@ class OllamaService:
             )
             
             if response.status_code == 200:
-                result = response.json()
+                # Parse the raw body bytes directly; response.json() first
+                # decodes the whole body into a str (with charset detection)
+                result = json.loads(response.content)
                 generated_text = result.get('response', '').strip()
                 return generated_text
             else:
-                print(f"[OllamaService] Generation failed: HTTP {response.status_code}")
+                logger.warning("Generation failed: HTTP %s", response.status_code)
                 return None
                 
         except requests.Timeout:
-            print(f"[OllamaService] Timeout after {timeout_ms}ms")
+            logger.warning("Timeout after %sms", timeout_ms)
             return None
         except Exception as e:
-            print(f"[OllamaService] Error: {e}")
+            logger.warning("Error: %s", e)
             return None
     
     def enhance_text(
@@ -158,12 +190,13 @@ class OllamaService:
         )
 
         # Limit output to 3x input length to prevent runaway generation
-        input_words = len(text.split())
+        # Count words like len(text.split()) without allocating the list
+        input_words = sum(1 for _ in re.finditer(r"\S+", text))
         max_output_tokens = max(50, input_words * 6)  # ~3x words, 2 tokens per word
 
         return self.generate(
             prompt=prompt,
-            temperature=0.1,
+            temperature=self.DEFAULT_TEMPERATURE,
             max_tokens=max_output_tokens,
             timeout_ms=timeout_ms
         )
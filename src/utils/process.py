@@ -6,6 +6,7 @@ Provides utilities for process management, locking, and thread safety
 
 import os
 import sys
+import errno
 import fcntl
 import threading
 from typing import Optional
@@ -32,7 +33,7 @@ class SingleInstanceLock:
             os.path.dirname(os.path.abspath(__file__)),
             '.whisper_instance.lock'
         )
-        self.lock_file = None
+        self._fd: Optional[int] = None
         self._lock = threading.RLock()
     
     def acquire(self) -> bool:
@@ -43,33 +44,38 @@ class SingleInstanceLock:
             bool: True if successful, False if another instance has the lock
         """
         with self._lock:
+            # Open without truncating so a failed acquire keeps the owner's PID
+            fd = os.open(self.lock_file_path, os.O_CREAT | os.O_WRONLY, 0o644)
             try:
-                self.lock_file = open(self.lock_file_path, 'w')
-                fcntl.lockf(self.lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
-                # Write PID to the lock file
-                self.lock_file.write(str(os.getpid()))
-                self.lock_file.flush()
-                return True
-            except IOError:
-                # Another instance has the lock
-                if self.lock_file:
-                    self.lock_file.close()
-                    self.lock_file = None
-                return False
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError as e:
+                os.close(fd)
+                if e.errno in (errno.EWOULDBLOCK, errno.EAGAIN):
+                    # Another instance has the lock
+                    return False
+                raise
+
+            # Write PID to the lock file
+            os.ftruncate(fd, 0)
+            os.write(fd, str(os.getpid()).encode())
+            self._fd = fd
+            return True
     
     def release(self) -> None:
-        """Release the lock"""
+        """
+        Release the lock
+
+        The lock file is intentionally left on disk: unlinking it after
+        unlocking would let a second instance lock the old file and then
+        lose it from under itself.
+        """
         with self._lock:
-            if self.lock_file:
+            if self._fd is not None:
                 try:
-                    fcntl.lockf(self.lock_file, fcntl.LOCK_UN)
-                    self.lock_file.close()
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+                    os.close(self._fd)
                 finally:
-                    self.lock_file = None
-                    try:
-                        os.unlink(self.lock_file_path)
-                    except:
-                        pass  # Ignore cleanup errors
+                    self._fd = None
     
     def __enter__(self):
         """Context manager entry"""
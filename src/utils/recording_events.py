@@ -4,7 +4,8 @@ Allows keyboard service to track recording events.
 """
 
 import threading
-from typing import Callable, Dict, List
+from collections import defaultdict
+from typing import Callable, DefaultDict, List
 from enum import Enum
 
 
@@ -13,6 +14,13 @@ class RecordingEvent(Enum):
     MANUAL_STOP_REQUESTED = "manual_stop_requested"
     MANUAL_RECORDING_STARTED = "manual_recording_started"
     MANUAL_RECORDING_STOPPED = "manual_recording_stopped"
+    WAKE_WORD_RECORDING_STARTED = "wake_word_recording_started"
+    WAKE_WORD_RECORDING_STOPPED = "wake_word_recording_stopped"
+
+
+# Recording state bit flags
+_MANUAL = 1
+_WAKE_WORD = 2
 
 
 class RecordingEventManager:
@@ -26,15 +34,14 @@ class RecordingEventManager:
     """
     
     def __init__(self):
-        self._subscribers: Dict[RecordingEvent, List[Callable]] = {}
+        self._subscribers: DefaultDict[RecordingEvent, List[Callable]] = defaultdict(list)
         self._lock = threading.Lock()
-        self._manual_recording = False
+        # Bitmask of active recordings; a single int read needs no lock
+        self._state: int = 0
     
     def subscribe(self, event: RecordingEvent, callback: Callable) -> None:
         """Subscribe to a recording event"""
         with self._lock:
-            if event not in self._subscribers:
-                self._subscribers[event] = []
             self._subscribers[event].append(callback)
     
     def emit(self, event: RecordingEvent, **kwargs) -> None:
@@ -42,25 +49,29 @@ class RecordingEventManager:
         with self._lock:
             # Update internal state
             if event == RecordingEvent.MANUAL_RECORDING_STARTED:
-                self._manual_recording = True
+                self._state |= _MANUAL
             elif event == RecordingEvent.MANUAL_RECORDING_STOPPED:
-                self._manual_recording = False
+                self._state &= ~_MANUAL
+            elif event == RecordingEvent.WAKE_WORD_RECORDING_STARTED:
+                self._state |= _WAKE_WORD
+            elif event == RecordingEvent.WAKE_WORD_RECORDING_STOPPED:
+                self._state &= ~_WAKE_WORD
             
-            # Notify subscribers
-            if event in self._subscribers:
-                for callback in self._subscribers[event]:
-                    try:
-                        callback(**kwargs)
-                    except Exception as e:
-                        print(f"Error in event callback for {event}: {e}")
-    
+            # Notify subscribers (.get avoids creating entries for unused events)
+            for callback in self._subscribers.get(event, ()):
+                try:
+                    callback(**kwargs)
+                except Exception as e:
+                    print(f"Error in event callback for {event}: {e}")
     
     def is_manual_recording(self) -> bool:
         """Check if manual recording is currently active"""
-        with self._lock:
-            return self._manual_recording
+        return bool(self._state & _MANUAL)
+
+    def is_wake_word_recording(self) -> bool:
+        """Check if wake word recording is currently active"""
+        return bool(self._state & _WAKE_WORD)
     
     def is_any_recording(self) -> bool:
         """Check if any recording is currently active"""
-        with self._lock:
-            return self._manual_recording
\ No newline at end of file
+        return self._state != 0
\ No newline at end of file
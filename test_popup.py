@@ -7,7 +7,6 @@ Run this to test the popup functionality independently
 import sys
 import time
 import threading
-sys.path.append('src')
 
 def test_popup():
     """Test the recording popup functionality"""
@@ -15,7 +14,9 @@ def test_popup():
     print("🧪 Testing Recording Popup...")
     
     try:
-        from src.gui.recording_popup import show_recording_popup, hide_recording_popup, is_recording_popup_visible
+        from src.gui.recording_popup import (
+            show_recording_popup, hide_recording_popup, is_recording_popup_visible, wait_for_recording_popup_close
+        )
         
         # Test callbacks
         def on_stop():
@@ -39,19 +40,16 @@ def test_popup():
         
         # Keep popup open for 10 seconds for manual testing
         print("⏰ Popup will auto-close in 10 seconds (or click Stop/Cancel to test callbacks)")
-        for i in range(10):
-            if not is_recording_popup_visible():
-                print("✅ Popup was closed by user interaction")
-                return True
-            print(f"⏳ {10-i} seconds remaining...")
-            time.sleep(1)
+        # Returns as soon as Stop/Cancel hides the popup
+        if wait_for_recording_popup_close(timeout=10):
+            print("✅ Popup was closed by user interaction")
+            return True
         
         # Auto-close after 10 seconds
         print("⏰ Auto-closing popup...")
         hide_recording_popup()
         
-        # Verify popup is hidden
-        time.sleep(0.5)
+        # Verify popup is hidden (hiding is synchronous)
         if not is_recording_popup_visible():
             print("✅ Popup successfully hidden")
             return True
@@ -137,7 +135,8 @@ def test_integration():
             print("🎤 Audio monitoring should be active - try speaking!")
             print("⏰ Auto-closing in 8 seconds...")
             
-            time.sleep(8)
+            # Pumps Qt events meanwhile so the waveform actually updates
+            manager.wait_until_closed(timeout=8)
             
             manager.hide_recording_popup()
             
@@ -3,17 +3,8 @@
 Test the PyQt6-based recording popup
 """
 
-import sys
-import os
-import time
-import threading
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from gui.recording_popup import RecordingPopup
-from utils.audio_monitor import MockAudioMonitor
-from PyQt6.QtWidgets import QApplication
+from src.gui.recording_popup import RecordingPopup, get_qt_application
+from src.utils.audio_monitor import MockAudioMonitor
 
 
 def test_popup():
@@ -23,8 +14,8 @@ def test_popup():
     print("✓ No dock icon")
     print("✓ Proper floating window")
 
-    # Create QApplication (required for PyQt)
-    app = QApplication(sys.argv)
+    # Get the shared QApplication (required for PyQt)
+    app = get_qt_application()
 
     # Prevent app from appearing in dock
     app.setQuitOnLastWindowClosed(False)
@@ -3,16 +3,10 @@
 Test the redesigned recording popup with gradient background and waveform
 """
 
-import time
-import threading
-import sys
-import os
+import random
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from gui.recording_popup import RecordingPopup
-from utils.audio_monitor import MockAudioMonitor
+from src.gui.recording_popup import RecordingPopup
+from PyQt6.QtCore import QTimer
 
 
 def test_popup():
@@ -31,11 +25,11 @@ def test_popup():
         on_cancel_callback=on_cancel
     )
 
-    # Create mock audio monitor with callback
-    audio_monitor = MockAudioMonitor(callback=popup.update_audio_level)
-
-    # Start audio monitoring
-    audio_monitor.start_monitoring()
+    # Feed fake audio levels at ~30 Hz from a QTimer on the Qt thread
+    # (no mock monitor thread needed when there is no real device)
+    level_timer = QTimer()
+    level_timer.timeout.connect(lambda: popup.update_audio_level(random.random() * 0.3))
+    level_timer.start(33)
 
     # Show popup
     popup.show()
@@ -49,15 +43,16 @@ def test_popup():
     print("✓ Should NOT steal focus from other windows")
     print("✓ Should stay visible when clicking elsewhere")
 
-    # Keep popup open for 10 seconds
+    # Keep popup open for 10 seconds, running the Qt event loop so it paints
     try:
         print("\nPopup will stay open for 10 seconds...")
         print("Try clicking on other windows - popup should stay visible")
-        time.sleep(10)
+        QTimer.singleShot(10_000, popup.app.quit)
+        popup.app.exec()
     except KeyboardInterrupt:
         print("\nTest interrupted")
     finally:
-        audio_monitor.stop_monitoring()
+        level_timer.stop()
         popup.hide()
         # Exit the Qt app if it was created
         if hasattr(popup, 'app') and popup.app: